@@ -1,25 +1,45 @@
 import networkx as nx
 import matplotlib.pyplot as plt
 import random
+import numpy as np
+from collections import deque
 import tkinter as tk
 from tkinter import ttk, messagebox
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
-# Function to generate a directed graph
-def generate_directed_graph(n):
+# Function to generate a directed graph (min_weight < 0 allows negative edges)
+def generate_directed_graph(n, min_weight=1, max_weight=100):
     G = nx.DiGraph()
     for i in range(n):
         G.add_node(f"X{i}", size=800)
     for i in range(n):
         for j in range(i + 1, n):
             if random.choice([True, False]):
-                weight = random.randint(1, 100)
+                weight = random.randint(min_weight, max_weight)
                 G.add_edge(f"X{i}", f"X{j}", weight=weight)
             else:
-                weight = random.randint(1, 100)
+                weight = random.randint(min_weight, max_weight)
                 G.add_edge(f"X{j}", f"X{i}", weight=weight)
     return G
 
+# Function to generate a random directed graph straight into (src, dst, weight) arrays
+def generate_edge_arrays(n, num_edges, min_weight=1, max_weight=100, seed=None):
+    rng = np.random.default_rng(seed)
+    src = rng.integers(0, n, size=num_edges)
+    dst = rng.integers(0, n, size=num_edges)
+    keep = src != dst
+    weight = rng.integers(min_weight, max_weight + 1, size=num_edges)
+    return src[keep], dst[keep], weight[keep].astype(float)
+
+# Function to convert a graph into node labels plus (src, dst, weight) arrays
+def graph_to_edge_arrays(G):
+    nodes = list(G.nodes())
+    index = {node: i for i, node in enumerate(nodes)}
+    src = np.fromiter((index[u] for u, _ in G.edges()), dtype=np.int64, count=G.number_of_edges())
+    dst = np.fromiter((index[v] for _, v in G.edges()), dtype=np.int64, count=G.number_of_edges())
+    weight = np.fromiter((d.get('weight', 1) for _, _, d in G.edges(data=True)), dtype=float, count=G.number_of_edges())
+    return nodes, src, dst, weight
+
 # Function to display the graph on a Tkinter canvas
 def display_graph(G, canvas_frame, path=None):
     pos = nx.spring_layout(G, seed=42)
@@ -36,14 +56,125 @@ def display_graph(G, canvas_frame, path=None):
     canvas.draw()
     canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
 
+# Queue-based Bellman-Ford (SPFA): one run gives distances and predecessors.
+# Nodes are relaxed in passes; a pass only revisits nodes whose distance changed in the
+# previous one, so the loop ends as soon as a pass changes nothing
+def bellman_ford_spfa(G, source):
+    if source not in G:
+        raise nx.NodeNotFound(f"Source {source} is not in G")
+    nodes = list(G.nodes())
+    index = {node: i for i, node in enumerate(nodes)}
+    adjacency = [[(index[v], data.get('weight', 1)) for v, data in G.adj[node].items()] for node in nodes]
+
+    n = len(nodes)
+    dist = [float('inf')] * n
+    pred = [-1] * n
+    in_queue = bytearray(n)
+    start = index[source]
+    dist[start] = 0
+    queue = deque([start])
+    in_queue[start] = 1
+    passes = 0
+    relaxations = 0
+
+    while queue:
+        passes += 1
+        # A shortest path has at most n - 1 edges; needing an n-th pass means a negative cycle
+        if passes > n:
+            raise nx.NetworkXUnbounded("Negative cycle detected.")
+        for _ in range(len(queue)):
+            u = queue.popleft()
+            in_queue[u] = 0
+            for v, weight in adjacency[u]:
+                if dist[u] + weight < dist[v]:
+                    dist[v] = dist[u] + weight
+                    pred[v] = u
+                    relaxations += 1
+                    if not in_queue[v]:
+                        in_queue[v] = 1
+                        queue.append(v)
+
+    distances = {node: dist[i] for i, node in enumerate(nodes) if dist[i] != float('inf')}
+    predecessors = {node: nodes[pred[i]] for i, node in enumerate(nodes) if pred[i] != -1}
+    return distances, predecessors, {"passes": passes, "relaxations": relaxations}
+
+# Bellman-Ford over edge arrays: every pass relaxes all edges at once with np.minimum.at.
+# Returns (dist, pred, stats, cycle) where cycle is a list of node ids closing on itself
+# if a relaxation still succeeds after n - 1 passes, else None
+def bellman_ford_vectorized(n, src, dst, weight, source):
+    dist = np.full(n, np.inf)
+    pred = np.full(n, -1, dtype=np.int64)
+    dist[source] = 0
+    passes = 0
+    relaxations = 0
+
+    for passes in range(1, n + 1):
+        candidate = dist[src] + weight
+        improving = candidate < dist[dst]
+        if not improving.any():
+            return dist, pred, {"passes": passes, "relaxations": relaxations}, None
+        new_dist = dist.copy()
+        np.minimum.at(new_dist, dst[improving], candidate[improving])
+        # Keep as predecessor one of the edges that produced each new minimum
+        winners = improving & (candidate == new_dist[dst])
+        pred[dst[winners]] = src[winners]
+        relaxations += int(winners.sum())
+        dist = new_dist
+        if passes == n:
+            # The n-th pass still improved something: walk predecessors to the cycle
+            cycle = _find_predecessor_cycle(pred, dst[winners])
+            return dist, pred, {"passes": passes, "relaxations": relaxations}, cycle
+
+    return dist, pred, {"passes": passes, "relaxations": relaxations}, None
+
+# Function to extract a cycle from the predecessor graph, starting from the given nodes
+def _find_predecessor_cycle(pred, starts):
+    pred = pred.tolist()
+    for start in np.unique(starts).tolist():
+        seen = {}
+        v = start
+        while v != -1 and v not in seen:
+            seen[v] = len(seen)
+            v = pred[v]
+        if v != -1:
+            cycle = [v]
+            u = pred[v]
+            while u != v:
+                cycle.append(u)
+                u = pred[u]
+            cycle.append(v)
+            cycle.reverse()
+            return cycle
+    return None
+
+# Label-level wrapper: (distances, predecessors, stats, negative cycle or None)
+def bellman_ford_arrays(G, source):
+    if source not in G:
+        raise nx.NodeNotFound(f"Source {source} is not in G")
+    nodes, src, dst, weight = graph_to_edge_arrays(G)
+    dist, pred, stats, cycle = bellman_ford_vectorized(len(nodes), src, dst, weight, nodes.index(source))
+    if cycle is not None:
+        return None, None, stats, [nodes[i] for i in cycle]
+    distances = {node: dist[i].item() for i, node in enumerate(nodes) if np.isfinite(dist[i])}
+    predecessors = {node: nodes[pred[i]] for i, node in enumerate(nodes) if pred[i] != -1}
+    return distances, predecessors, stats, None
+
+# Function to rebuild the source -> target path from a predecessor map
+def build_path(predecessors, source, target):
+    path = [target]
+    while path[-1] != source:
+        path.append(predecessors[path[-1]])
+    path.reverse()
+    return path
+
 # Function to apply Bellman-Ford algorithm
 def bellman_ford_graph(G, source, target):
-    try:
-        distance = nx.single_source_bellman_ford_path_length(G, source)
-        path = nx.single_source_bellman_ford_path(G, source)[target]
-        return path, distance[target]
-    except nx.NetworkXNoPath:
+    if target not in G:
+        raise nx.NodeNotFound(f"Target {target} is not in G")
+    distances, predecessors, _ = bellman_ford_spfa(G, source)
+    if target not in distances:
         return None, None
+    return build_path(predecessors, source, target), distances[target]
 
 # Main Tkinter window
 def bellmanford():
@@ -81,6 +212,12 @@ def bellmanford():
     ttk.Label(input_frame, text="Target node (e.g., X0...XN):", font=("Arial", 12)).grid(row=2, column=0, padx=5, pady=5)
     target_node_entry = ttk.Entry(input_frame, width=10, font=("Arial", 12))
     target_node_entry.grid(row=2, column=1, padx=5, pady=5)
+    ttk.Label(input_frame, text="Engine:", font=("Arial", 12)).grid(row=3, column=0, padx=5, pady=5)
+    engine_choice = ttk.Combobox(input_frame, values=["SPFA", "Vectorized"], state="readonly", width=12)
+    engine_choice.current(0)
+    engine_choice.grid(row=3, column=1, padx=5, pady=5)
+    negative_weights = tk.BooleanVar(master=root, value=False)
+    ttk.Checkbutton(input_frame, text="Allow negative weights", variable=negative_weights).grid(row=4, column=0, columnspan=2, pady=5)
 
     # Create rounded button
     def create_rounded_button(master, text, command):
@@ -154,8 +291,31 @@ def bellmanford():
             target_node = target_node_entry.get()
             if not (start_node and target_node and start_node.startswith("X") and target_node.startswith("X")):
                 raise ValueError("Invalid start or target node.")
-            G = generate_directed_graph(num_nodes)
-            path, distance = bellman_ford_graph(G, start_node, target_node)
+            G = generate_directed_graph(num_nodes, min_weight=-20 if negative_weights.get() else 1)
+            if target_node not in G:
+                raise nx.NodeNotFound(f"Target {target_node} is not in G")
+            if engine_choice.get() == "Vectorized":
+                distances, predecessors, stats, cycle = bellman_ford_arrays(G, start_node)
+            else:
+                try:
+                    distances, predecessors, stats = bellman_ford_spfa(G, start_node)
+                    cycle = None
+                except nx.NetworkXUnbounded:
+                    # Re-run on edge arrays to recover the cycle itself
+                    distances, predecessors, stats, cycle = bellman_ford_arrays(G, start_node)
+
+            if cycle is not None:
+                for widget in canvas_frame.winfo_children():
+                    widget.destroy()
+                display_graph(G, canvas_frame, cycle)
+                cycle_weight = sum(G[u][v]['weight'] for u, v in zip(cycle, cycle[1:]))
+                result_label.config(text=f"Negative cycle detected (weight {cycle_weight}):\n{' -> '.join(cycle)}"
+                                         f"\nPasses: {stats['passes']}, relaxations: {stats['relaxations']}")
+                return
+            if target_node in distances:
+                path, distance = build_path(predecessors, start_node, target_node), distances[target_node]
+            else:
+                path, distance = None, None
             # Clear the canvas and render the new graph
             for widget in canvas_frame.winfo_children():
                 widget.destroy()
@@ -163,9 +323,11 @@ def bellmanford():
             if path:
                 result_label.config(
                     text=f"Distance from {start_node} to {target_node}: {distance}\nPath: {' -> '.join(path)}"
+                         f"\nPasses: {stats['passes']}, relaxations: {stats['relaxations']}"
                 )
             else:
-                result_label.config(text=f"No path from {start_node} to {target_node}.")
+                result_label.config(text=f"No path from {start_node} to {target_node}."
+                                         f"\nPasses: {stats['passes']}, relaxations: {stats['relaxations']}")
         except ValueError as e:
             messagebox.showerror("Input Error", str(e))
         except Exception as e:
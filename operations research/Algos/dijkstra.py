@@ -2,6 +2,13 @@ import matplotlib.pyplot as plt
 import networkx as nx
 import random
 import heapq
+import os
+import time
+import tempfile
+import multiprocessing
+from collections import namedtuple
+from collections.abc import Mapping
+import numpy as np
 import tkinter as tk
 from tkinter import ttk, messagebox
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
@@ -20,6 +27,97 @@ def generate_graph(num_nodes, max_weight=100):
     
     return graph
 
+# Static k-d tree over 2-D points (median splits on the widest axis, small leaves)
+class KDTree:
+    def __init__(self, points, leaf_size=16):
+        self.points = np.asarray(points, dtype=float)
+        self.index = np.arange(len(self.points))
+        self.leaf_size = leaf_size
+        # Each node is (start, end, axis, split, left, right); leaves have axis -1
+        self.nodes = []
+        self.root = self._build(0, len(self.points))
+
+    def _build(self, start, end):
+        node_id = len(self.nodes)
+        self.nodes.append(None)
+        if end - start <= self.leaf_size:
+            self.nodes[node_id] = (start, end, -1, 0.0, -1, -1)
+            return node_id
+        ids = self.index[start:end]
+        coords = self.points[ids]
+        axis = int(np.argmax(coords.max(axis=0) - coords.min(axis=0)))
+        mid = (end - start) // 2
+        self.index[start:end] = ids[np.argpartition(coords[:, axis], mid)]
+        split = self.points[self.index[start + mid], axis]
+        left = self._build(start, start + mid)
+        right = self._build(start + mid, end)
+        self.nodes[node_id] = (start, end, axis, split, left, right)
+        return node_id
+
+    # Function to find the k nearest points to `point`; returns [(squared distance, point id), ...]
+    def query(self, point, k):
+        best = []  # max-heap of (-squared distance, id)
+        stack = [(0.0, self.root)]
+        while stack:
+            bound, node_id = stack.pop()
+            if len(best) == k and bound >= -best[0][0]:
+                continue
+            start, end, axis, split, left, right = self.nodes[node_id]
+            if axis == -1:
+                ids = self.index[start:end]
+                d2 = ((self.points[ids] - point) ** 2).sum(axis=1)
+                for i, d in zip(ids.tolist(), d2.tolist()):
+                    if len(best) < k:
+                        heapq.heappush(best, (-d, i))
+                    elif d < -best[0][0]:
+                        heapq.heapreplace(best, (-d, i))
+                continue
+            diff = point[axis] - split
+            near, far = (left, right) if diff < 0 else (right, left)
+            # Push the far side first so the near side is searched first
+            stack.append((max(bound, diff * diff), far))
+            stack.append((bound, near))
+        return sorted((-d, i) for d, i in best)
+
+# Function to generate a geometric graph: random points in a square, each joined to its
+# k nearest neighbours (found with a k-d tree), weighted by Euclidean distance
+def generate_euclidean_csr(num_nodes, k=6, size=1000.0, seed=None):
+    rng = np.random.default_rng(seed)
+    coords = rng.random((num_nodes, 2)) * size
+    tree = KDTree(coords)
+    edges = set()
+    for i in range(num_nodes):
+        for _, j in tree.query(coords[i], k + 1):
+            if j != i:
+                edges.add((min(i, j), max(i, j)))
+
+    adjacency = [[] for _ in range(num_nodes)]
+    for i, j in edges:
+        weight = float(np.hypot(*(coords[i] - coords[j])))
+        adjacency[i].append((j, weight))
+        adjacency[j].append((i, weight))
+    offsets = [0]
+    targets = []
+    weights = []
+    for neighbours in adjacency:
+        for j, weight in neighbours:
+            targets.append(j)
+            weights.append(weight)
+        offsets.append(len(targets))
+    labels = [f"X{i+1}" for i in range(num_nodes)]
+    return CSRGraph(labels, offsets, targets, weights), coords
+
+# Same instance as a networkx graph, with each node's coordinates in its 'pos' attribute
+def generate_euclidean_graph(num_nodes, k=6, seed=None):
+    csr, coords = generate_euclidean_csr(num_nodes, k, seed=seed)
+    graph = nx.Graph()
+    for i, label in enumerate(csr.labels):
+        graph.add_node(label, pos=tuple(coords[i]))
+    for u in range(num_nodes):
+        for idx in range(csr.offsets[u], csr.offsets[u + 1]):
+            graph.add_edge(csr.labels[u], csr.labels[csr.targets[idx]], weight=csr.weights[idx])
+    return graph
+
 # Standard Dijkstra's algorithm function
 def dijkstra(graph, start_node):
     priority_queue = [(0, start_node)]  # (distance, node)
@@ -52,9 +150,768 @@ def dijkstra(graph, start_node):
 
     return distances, paths
 
+# Flat adjacency (CSR) view of a graph: node i's edges are targets/weights[offsets[i]:offsets[i+1]]
+CSRGraph = namedtuple("CSRGraph", ["labels", "offsets", "targets", "weights"])
+
+# Function to convert a networkx graph into integer-indexed CSR arrays (done once per graph)
+def graph_to_csr(graph):
+    labels = list(graph.nodes())
+    index = {label: i for i, label in enumerate(labels)}
+    offsets = [0]
+    targets = []
+    weights = []
+    for label in labels:
+        for neighbor, data in graph.adj[label].items():
+            targets.append(index[neighbor])
+            weights.append(data['weight'])
+        offsets.append(len(targets))
+    return CSRGraph(labels, offsets, targets, weights)
+
+# Above this many nodes the "Bucket queue" engine runs on a sparse CSR instance: the complete
+# graph would need n^2 networkx edges and could not be drawn anyway
+LARGE_GRAPH_NODES = 2000
+
+# Function to generate a sparse undirected graph straight into CSR arrays (no networkx objects)
+def generate_csr_graph(num_nodes, degree=4, max_weight=100, seed=None):
+    rng = np.random.default_rng(seed)
+    src = np.repeat(np.arange(num_nodes), degree)
+    dst = rng.integers(0, num_nodes, size=src.size)
+    keep = src != dst
+    src, dst = src[keep], dst[keep]
+    weight = rng.integers(1, max_weight + 1, size=src.size)
+
+    # Store each edge in both directions and group the entries by source node
+    src, dst = np.concatenate([src, dst]), np.concatenate([dst, src])
+    weight = np.concatenate([weight, weight])
+    order = np.argsort(src, kind="stable")
+    offsets = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=num_nodes), out=offsets[1:])
+    labels = [f"X{i+1}" for i in range(num_nodes)]
+    return CSRGraph(labels, offsets.tolist(), dst[order].tolist(), weight[order].tolist())
+
+# Dijkstra with a Dial bucket queue over CSR arrays, for integer weights in [0, max_weight]
+def dijkstra_buckets(csr, source, max_weight=100):
+    offsets, targets, weights = csr.offsets, csr.targets, csr.weights
+    if weights and (min(weights) < 0 or max(weights) > max_weight or not all(isinstance(w, int) for w in weights)):
+        raise ValueError(f"Bucket queue needs integer weights between 0 and {max_weight}.")
+
+    n = len(offsets) - 1
+    dist = [float('inf')] * n
+    pred = [-1] * n
+    settled = bytearray(n)
+
+    # Tentative distances never exceed the current one by more than max_weight,
+    # so max_weight + 1 circular buckets are enough
+    num_buckets = max_weight + 1
+    buckets = [[] for _ in range(num_buckets)]
+    dist[source] = 0
+    buckets[0].append(source)
+    pending = 1
+    current = 0
+
+    while pending:
+        bucket = buckets[current % num_buckets]
+        while bucket:
+            u = bucket.pop()
+            pending -= 1
+            # Skip stale entries left behind by a later improvement
+            if settled[u] or dist[u] != current:
+                continue
+            settled[u] = 1
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                new_distance = current + weights[k]
+                if new_distance < dist[v]:
+                    dist[v] = new_distance
+                    pred[v] = u
+                    buckets[new_distance % num_buckets].append(v)
+                    pending += 1
+        current += 1
+
+    return dist, pred
+
+# Binary-heap Dijkstra over CSR arrays, for any non-negative weights
+def dijkstra_heap(csr, source):
+    offsets, targets, weights = csr.offsets, csr.targets, csr.weights
+    n = len(offsets) - 1
+    dist = [float('inf')] * n
+    pred = [-1] * n
+    dist[source] = 0
+    heap = [(0, source)]
+    while heap:
+        d, u = heapq.heappop(heap)
+        if d != dist[u]:
+            continue
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            new_distance = d + weights[k]
+            if new_distance < dist[v]:
+                dist[v] = new_distance
+                pred[v] = u
+                heapq.heappush(heap, (new_distance, v))
+    return dist, pred
+
+# Single-source (dist, pred): bucket queue for integer weights no larger than the node count
+# (the buckets are scanned one distance unit at a time), binary heap otherwise
+def shortest_path_tree(csr, source):
+    if all(isinstance(w, int) for w in csr.weights):
+        max_weight = max(csr.weights, default=0)
+        if max_weight <= len(csr.labels):
+            return dijkstra_buckets(csr, source, max_weight)
+    return dijkstra_heap(csr, source)
+
+# A* over CSR arrays with the straight-line heuristic; without coords it is plain Dijkstra
+# stopped at the target. Returns (distance, [node ids...], expanded node count)
+def astar(csr, source, target, coords=None):
+    if coords is not None:
+        coords = np.asarray(coords, dtype=float)
+        h = np.hypot(coords[:, 0] - coords[target, 0], coords[:, 1] - coords[target, 1]).tolist()
+    else:
+        h = [0.0] * (len(csr.offsets) - 1)
+    dist = {source: 0}
+    pred = {source: -1}
+    heap = [(h[source], 0, source)]
+    expanded = 0
+    while heap:
+        _, d, u = heapq.heappop(heap)
+        if d != dist[u]:
+            continue
+        expanded += 1
+        if u == target:
+            path = [u]
+            while pred[path[-1]] != -1:
+                path.append(pred[path[-1]])
+            path.reverse()
+            return d, path, expanded
+        for k in range(csr.offsets[u], csr.offsets[u + 1]):
+            v = csr.targets[k]
+            new_distance = d + csr.weights[k]
+            if new_distance < dist.get(v, float('inf')):
+                dist[v] = new_distance
+                pred[v] = u
+                heapq.heappush(heap, (new_distance + h[v], new_distance, v))
+    return float('inf'), [], expanded
+
+# Label-level A* on a graph whose nodes carry 'pos' coordinates
+# Returns (distance, [labels...], A* expanded nodes, Dijkstra expanded nodes)
+def astar_query(graph, start_node, target_node):
+    csr = graph_to_csr(graph)
+    coords = [graph.nodes[label]['pos'] for label in csr.labels]
+    source = csr.labels.index(start_node)
+    target = csr.labels.index(target_node)
+    distance, path, expanded = astar(csr, source, target, coords)
+    _, _, dijkstra_expanded = astar(csr, source, target)
+    return distance, [csr.labels[i] for i in path], expanded, dijkstra_expanded
+
+# Function to rebuild one path from a predecessor array (empty if unreachable)
+def build_path(pred, source, target):
+    if target != source and pred[target] == -1:
+        return []
+    path = [target]
+    while path[-1] != source:
+        path.append(pred[path[-1]])
+    path.reverse()
+    return path
+
+# Read-only {label: [labels...]} view that only builds a path when it is looked up
+class LazyPaths(Mapping):
+    def __init__(self, labels, pred, source):
+        self.labels = labels
+        self.index = {label: i for i, label in enumerate(labels)}
+        self.pred = pred
+        self.source = source
+
+    def __getitem__(self, label):
+        path = build_path(self.pred, self.source, self.index[label])
+        return [self.labels[i] for i in path]
+
+    def __iter__(self):
+        return iter(self.labels)
+
+    def __len__(self):
+        return len(self.labels)
+
+# CSR Dijkstra with the same (distances, paths) result shape as dijkstra(): bucket queue
+# for integer weights, binary heap otherwise (e.g. the Euclidean instance)
+def dijkstra_fast(graph, start_node):
+    csr = graph if isinstance(graph, CSRGraph) else graph_to_csr(graph)
+    source = csr.labels.index(start_node)
+    dist, pred = shortest_path_tree(csr, source)
+    distances = dict(zip(csr.labels, dist))
+    return distances, LazyPaths(csr.labels, pred, source)
+
+# Point-to-point bidirectional Dijkstra; reverse_csr defaults to csr for undirected graphs
+# Returns (distance, path, settled) where settled counts nodes finalised by both searches
+def bidirectional_dijkstra(csr, source, target, reverse_csr=None):
+    reverse_csr = reverse_csr or csr
+    n = len(csr.offsets) - 1
+    if source == target:
+        return 0, [source], 1
+
+    sides = []
+    for graph in (csr, reverse_csr):
+        dist = {source if not sides else target: 0}
+        pred = {source if not sides else target: -1}
+        heap = [(0, source if not sides else target)]
+        sides.append((graph, dist, pred, heap, bytearray(n)))
+
+    best = float('inf')
+    meeting = -1
+    settled = 0
+
+    while sides[0][3] and sides[1][3]:
+        # Stop once no undiscovered path can beat the best meeting point
+        if sides[0][3][0][0] + sides[1][3][0][0] >= best:
+            break
+        # Expand the side with the smaller frontier
+        side = 0 if len(sides[0][3]) <= len(sides[1][3]) else 1
+        graph, dist, pred, heap, done = sides[side]
+        other_dist = sides[1 - side][1]
+
+        d, u = heapq.heappop(heap)
+        if done[u]:
+            continue
+        done[u] = 1
+        settled += 1
+        for k in range(graph.offsets[u], graph.offsets[u + 1]):
+            v = graph.targets[k]
+            new_distance = d + graph.weights[k]
+            if new_distance < dist.get(v, float('inf')):
+                dist[v] = new_distance
+                pred[v] = u
+                heapq.heappush(heap, (new_distance, v))
+            if v in other_dist and new_distance + other_dist[v] < best:
+                best = new_distance + other_dist[v]
+                meeting = v
+
+    if meeting == -1:
+        return float('inf'), [], settled
+
+    # Join source -> meeting and meeting -> target halves
+    forward, backward = sides[0][2], sides[1][2]
+    path = [meeting]
+    while forward[path[-1]] != -1:
+        path.append(forward[path[-1]])
+    path.reverse()
+    while backward[path[-1]] != -1:
+        path.append(backward[path[-1]])
+    return best, path, settled
+
+# Label-level wrapper used by the GUI: returns (distance, [labels...], settled)
+def shortest_path_query(graph, start_node, target_node):
+    csr = graph if isinstance(graph, CSRGraph) else graph_to_csr(graph)
+    source = csr.labels.index(start_node)
+    target = csr.labels.index(target_node)
+    distance, path, settled = bidirectional_dijkstra(csr, source, target)
+    return distance, [csr.labels[i] for i in path], settled
+
+# Function to write the direct-edge distance matrix into `out` (a new array if None), one block
+# of rows at a time straight from the CSR offsets, so only block_rows x n floats are ever in memory
+def csr_to_matrix(csr, out=None, block_rows=1024):
+    n = len(csr.offsets) - 1
+    if out is None:
+        out = np.empty((n, n))
+    offsets = np.asarray(csr.offsets, dtype=np.int64)
+    targets = np.asarray(csr.targets, dtype=np.int64)
+    weights = np.asarray(csr.weights, dtype=float)
+    for start in range(0, n, block_rows):
+        stop = min(n, start + block_rows)
+        block = np.full((stop - start, n), np.inf)
+        rows = np.repeat(np.arange(stop - start), np.diff(offsets[start:stop + 1]))
+        edges = slice(offsets[start], offsets[stop])
+        np.minimum.at(block, (rows, targets[edges]), weights[edges])
+        block[np.arange(stop - start), np.arange(start, stop)] = 0
+        out[start:stop] = block
+    return out
+
+# Floyd-Warshall written into `out` (an n x n array or memmap) as one min-plus update per pivot,
+# processed in row blocks so memmapped matrices are never loaded whole
+def floyd_warshall_matrix(csr, out, block_rows=1024):
+    n = out.shape[0]
+    csr_to_matrix(csr, out, block_rows)
+    for k in range(n):
+        pivot_row = np.array(out[k])
+        for start in range(0, n, block_rows):
+            block = out[start:start + block_rows]
+            np.minimum(block, block[:, k:k + 1] + pivot_row, out=block)
+    return out
+
+# Worker state for the process pool (set once per worker by _init_all_pairs_worker)
+_worker_csr = None
+_worker_out = None
+
+def _init_all_pairs_worker(csr, path, n):
+    global _worker_csr, _worker_out
+    _worker_csr = csr
+    _worker_out = np.memmap(path, dtype=np.float64, mode="r+", shape=(n, n))
+
+def _all_pairs_row(source):
+    dist, _ = shortest_path_tree(_worker_csr, source)
+    _worker_out[source] = dist
+    return source
+
+# All-pairs shortest distances stored in a memory-mapped n x n float64 file
+# method: "floyd" (vectorized, for dense graphs), "dijkstra" (one run per source over a pool) or "auto"
+def all_pairs_distances(graph, path=None, method="auto", processes=None):
+    csr = graph if isinstance(graph, CSRGraph) else graph_to_csr(graph)
+    n = len(csr.offsets) - 1
+    if path is None:
+        handle, path = tempfile.mkstemp(suffix=".dist")
+        os.close(handle)
+    out = np.memmap(path, dtype=np.float64, mode="w+", shape=(n, n))
+
+    if method == "auto":
+        method = "floyd" if len(csr.targets) >= n * n // 4 else "dijkstra"
+    if method == "floyd":
+        floyd_warshall_matrix(csr, out)
+    elif method == "dijkstra":
+        out.flush()
+        with multiprocessing.Pool(processes, _init_all_pairs_worker, (csr, path, n)) as pool:
+            for _ in pool.imap_unordered(_all_pairs_row, range(n), chunksize=max(1, n // 64)):
+                pass
+    else:
+        raise ValueError(f"Unknown all-pairs method: {method}")
+    out.flush()
+    return csr.labels, out
+
+# Function to display a distance matrix as a table
+def display_distance_matrix(labels, matrix):
+    result = "\nAll-Pairs Shortest Distances:\n"
+    result += f"{'':<6}" + "".join(f"{label:<10}" for label in labels) + "\n"
+    for label, row in zip(labels, matrix):
+        result += f"{label:<6}" + "".join(f"{d:<10.6g}" if d != float('inf') else f"{'-':<10}" for d in row) + "\n"
+    return result
+
+# Shortest-path tree that is repaired in place after single edge weight changes
+# (Ramalingam-Reps style: only the part of the tree whose distances change is revisited)
+# tree, if given, is an already computed (dist, pred) for start_node and is reused as is
+class DynamicShortestPaths:
+    def __init__(self, csr, start_node, tree=None):
+        self.csr = csr
+        self.source = csr.labels.index(start_node)
+        self.dist, self.pred = tree if tree is not None else shortest_path_tree(csr, self.source)
+        self.children = [set() for _ in self.pred]
+        for v, u in enumerate(self.pred):
+            if u != -1:
+                self.children[u].add(v)
+        # CSR slots of every (u, v) entry, so weight edits do not scan adjacency lists
+        self.slots = {}
+        for u in range(len(csr.offsets) - 1):
+            for k in range(csr.offsets[u], csr.offsets[u + 1]):
+                self.slots.setdefault((u, csr.targets[k]), []).append(k)
+
+    def _set_pred(self, v, u):
+        if self.pred[v] != -1:
+            self.children[self.pred[v]].discard(v)
+        self.pred[v] = u
+        if u != -1:
+            self.children[u].add(v)
+
+    # Function to change the weight of edge (u, v); returns the number of nodes touched by the repair
+    def update_edge(self, node1, node2, new_weight):
+        if new_weight < 0:
+            raise ValueError("Edge weights must be non-negative.")
+        u, v = self.csr.labels.index(node1), self.csr.labels.index(node2)
+        if (u, v) not in self.slots:
+            raise ValueError(f"There is no edge between {node1} and {node2}.")
+        old_weight = self.csr.weights[self.slots[(u, v)][0]]
+        for key in ((u, v), (v, u)):
+            for k in self.slots.get(key, ()):
+                self.csr.weights[k] = new_weight
+
+        if new_weight < old_weight:
+            return self._repair_decrease(u, v, new_weight)
+        if new_weight > old_weight:
+            if self.pred[v] == u:
+                return self._repair_increase(v)
+            if self.pred[u] == v:
+                return self._repair_increase(u)
+        return 0
+
+    # A cheaper edge can only improve nodes reachable through it: resume Dijkstra from its endpoints
+    def _repair_decrease(self, u, v, weight):
+        dist, csr = self.dist, self.csr
+        heap = []
+        for a, b in ((u, v), (v, u)):
+            if dist[a] + weight < dist[b]:
+                dist[b] = dist[a] + weight
+                self._set_pred(b, a)
+                heapq.heappush(heap, (dist[b], b))
+
+        touched = set()
+        while heap:
+            d, x = heapq.heappop(heap)
+            if d != dist[x]:
+                continue
+            touched.add(x)
+            for k in range(csr.offsets[x], csr.offsets[x + 1]):
+                y = csr.targets[k]
+                new_distance = d + csr.weights[k]
+                if new_distance < dist[y]:
+                    dist[y] = new_distance
+                    self._set_pred(y, x)
+                    heapq.heappush(heap, (new_distance, y))
+        return len(touched)
+
+    # A costlier tree edge can only hurt the subtree below it: reset that subtree and
+    # re-run Dijkstra inside it, seeded from its best unaffected neighbours
+    def _repair_increase(self, root):
+        dist, csr = self.dist, self.csr
+        affected = set()
+        stack = [root]
+        while stack:
+            x = stack.pop()
+            affected.add(x)
+            stack.extend(self.children[x])
+        for x in affected:
+            dist[x] = float('inf')
+
+        heap = []
+        for x in affected:
+            for k in range(csr.offsets[x], csr.offsets[x + 1]):
+                y = csr.targets[k]
+                if y not in affected and dist[y] + csr.weights[k] < dist[x]:
+                    dist[x] = dist[y] + csr.weights[k]
+                    self._set_pred(x, y)
+            if dist[x] == float('inf'):
+                self._set_pred(x, -1)
+            else:
+                heapq.heappush(heap, (dist[x], x))
+
+        while heap:
+            d, x = heapq.heappop(heap)
+            if d != dist[x]:
+                continue
+            for k in range(csr.offsets[x], csr.offsets[x + 1]):
+                y = csr.targets[k]
+                new_distance = d + csr.weights[k]
+                if y in affected and new_distance < dist[y]:
+                    dist[y] = new_distance
+                    self._set_pred(y, x)
+                    heapq.heappush(heap, (new_distance, y))
+        return len(affected)
+
+    # Current (distances, paths) in the same shape as dijkstra()
+    def result(self):
+        return dict(zip(self.csr.labels, self.dist)), LazyPaths(self.csr.labels, self.pred, self.source)
+
+# Function to turn a (distances, paths) result of dijkstra()/dijkstra_fast() into (dist, pred) lists
+# indexed like csr.labels, so a DynamicShortestPaths can start from it without solving again
+def paths_to_tree(csr, distances, paths):
+    if isinstance(paths, LazyPaths) and paths.labels == csr.labels:
+        return [distances[label] for label in csr.labels], list(paths.pred)
+    index = {label: i for i, label in enumerate(csr.labels)}
+    pred = [index[paths[label][-2]] if len(paths[label]) > 1 else -1 for label in csr.labels]
+    return [distances[label] for label in csr.labels], pred
+
+# A* spur search used by Yen: avoids blocked nodes/edges and gives up once
+# root_cost + g + h reaches the bound; returns (path, cumulative costs) or None
+def _spur_search(csr, spur, target, root_cost, blocked_nodes, blocked_edges, potential, bound):
+    best = {spur: 0}
+    pred = {spur: -1}
+    heap = [(potential[spur], 0, spur)]
+    while heap:
+        f, g, u = heapq.heappop(heap)
+        if g != best[u]:
+            continue
+        if root_cost + f >= bound:
+            return None
+        if u == target:
+            path = [u]
+            while pred[path[-1]] != -1:
+                path.append(pred[path[-1]])
+            path.reverse()
+            return path, [best[x] for x in path]
+        for k in range(csr.offsets[u], csr.offsets[u + 1]):
+            v = csr.targets[k]
+            if v in blocked_nodes or (u, v) in blocked_edges:
+                continue
+            new_g = g + csr.weights[k]
+            if new_g < best.get(v, float('inf')):
+                best[v] = new_g
+                pred[v] = u
+                heapq.heappush(heap, (new_g + potential[v], new_g, v))
+    return None
+
+# Yen's K shortest loopless paths reusing a single-source tree (dist, pred) from `source`.
+# On undirected graphs |dist[target] - dist[x]| is a lower bound on the x -> target distance,
+# so the tree doubles as the A* potential for every spur search.
+# Returns a list of (cost, [node ids...]) sorted by cost
+def k_shortest_paths(csr, dist, pred, source, target, k):
+    if dist[target] == float('inf'):
+        return []
+    first = build_path(pred, source, target)
+    accepted = [(dist[target], first, [dist[x] for x in first])]
+    potential = [abs(dist[target] - d) for d in dist]
+    candidates = []
+    seen = {tuple(first)}
+
+    while len(accepted) < k:
+        _, last, last_costs = accepted[-1]
+        for i in range(len(last) - 1):
+            root = last[:i + 1]
+            blocked_edges = {(path[i], path[i + 1]) for _, path, _ in accepted if path[:i + 1] == root}
+            blocked_nodes = set(root[:-1])
+
+            # Only candidates cheaper than the ones already queued for the remaining slots matter
+            needed = k - len(accepted)
+            bound = heapq.nsmallest(needed, candidates)[-1][0] if len(candidates) >= needed else float('inf')
+
+            found = _spur_search(csr, last[i], target, last_costs[i], blocked_nodes, blocked_edges, potential, bound)
+            if found is None:
+                continue
+            spur_path, spur_costs = found
+            path = root[:-1] + spur_path
+            if tuple(path) in seen:
+                continue
+            seen.add(tuple(path))
+            costs = last_costs[:i] + [last_costs[i] + c for c in spur_costs]
+            heapq.heappush(candidates, (costs[-1], path, costs))
+
+        if not candidates:
+            break
+        accepted.append(heapq.heappop(candidates))
+
+    return [(cost, path) for cost, path, _ in accepted]
+
+# Label-level wrapper: returns [(cost, [labels...]), ...] for the K shortest paths
+def yen_k_shortest_paths(graph, start_node, target_node, k, tree=None):
+    csr = graph if isinstance(graph, CSRGraph) else graph_to_csr(graph)
+    source = csr.labels.index(start_node)
+    target = csr.labels.index(target_node)
+    dist, pred = tree if tree is not None else shortest_path_tree(csr, source)
+    return [(cost, [csr.labels[i] for i in path]) for cost, path in k_shortest_paths(csr, dist, pred, source, target, k)]
+
+# Bounded Dijkstra used while contracting: distances from `start` that avoid `skipped`,
+# stopping past `limit`, after `max_settled` nodes or `max_relaxed` edge relaxations, and never
+# following paths of more than `max_hops` edges (a missed witness only costs an extra shortcut)
+def _witness_search(adj, start, skipped, limit, max_settled, max_hops=5, max_relaxed=1000):
+    dist = {start: 0}
+    hops = {start: 0}
+    heap = [(0, start)]
+    settled = 0
+    relaxed = 0
+    while heap and settled < max_settled and relaxed < max_relaxed:
+        d, u = heapq.heappop(heap)
+        if d > limit:
+            break
+        if d != dist[u]:
+            continue
+        settled += 1
+        if hops[u] >= max_hops:
+            continue
+        for v, w in adj[u].items():
+            relaxed += 1
+            if v != skipped and d + w < dist.get(v, float('inf')):
+                dist[v] = d + w
+                hops[v] = hops[u] + 1
+                heapq.heappush(heap, (d + w, v))
+    return dist
+
+# Contraction-hierarchy index for repeated point-to-point queries on one undirected graph:
+# a node order (rank), the upward edges of every node (shortcuts included) as CSR arrays,
+# and the middle node of each shortcut so query paths can be unpacked
+class ContractionHierarchy:
+    def __init__(self, labels, rank, up, middle):
+        self.labels = labels
+        self.rank = rank
+        self.up = up
+        self.middle = middle
+
+    @classmethod
+    def build(cls, csr, witness_limit=64, hop_limit=5, relax_limit=1000):
+        n = len(csr.offsets) - 1
+        adj = [{} for _ in range(n)]
+        for u in range(n):
+            for k in range(csr.offsets[u], csr.offsets[u + 1]):
+                v, w = csr.targets[k], csr.weights[k]
+                if u != v and w < adj[u].get(v, float('inf')):
+                    adj[u][v] = w
+
+        # Shortcuts needed if v were contracted now: neighbour pairs with no witness path around v
+        def shortcuts_for(v, max_hops=hop_limit):
+            neighbours = list(adj[v].items())
+            shortcuts = []
+            for i, (a, wa) in enumerate(neighbours):
+                through_v = {b: wa + wb for b, wb in neighbours[i + 1:]}
+                if not through_v:
+                    continue
+                witness = _witness_search(adj, a, v, max(through_v.values()), witness_limit, max_hops, relax_limit)
+                for b, w in through_v.items():
+                    if witness.get(b, float('inf')) > w:
+                        shortcuts.append((a, b, w))
+            return shortcuts
+
+        # Edge difference plus contracted-neighbour count keeps the hierarchy balanced
+        contracted_neighbours = [0] * n
+        def priority(v, shortcuts):
+            return len(shortcuts) - len(adj[v]) + contracted_neighbours[v]
+
+        # Initial priorities from a cheap simulated contraction (one-hop witnesses only);
+        # the lazy updates below recompute them with the full bounded search
+        heap = [(priority(v, shortcuts_for(v, max_hops=1)), v) for v in range(n)]
+        heapq.heapify(heap)
+        rank = [0] * n
+        up_edges = [None] * n
+        middle = {}
+        order = 0
+
+        while heap:
+            _, v = heapq.heappop(heap)
+            if up_edges[v] is not None:
+                continue
+            # Lazy update: re-queue if the priority got worse than the next candidate
+            shortcuts = shortcuts_for(v)
+            current = priority(v, shortcuts)
+            if heap and current > heap[0][0]:
+                heapq.heappush(heap, (current, v))
+                continue
+
+            rank[v] = order
+            order += 1
+            up_edges[v] = list(adj[v].items())
+            for a in adj[v]:
+                del adj[a][v]
+                contracted_neighbours[a] += 1
+            adj[v] = {}
+            for a, b, w in shortcuts:
+                if w < adj[a].get(b, float('inf')):
+                    adj[a][b] = adj[b][a] = w
+                    middle[(a, b)] = middle[(b, a)] = v
+
+        offsets = [0]
+        targets = []
+        weights = []
+        for v in range(n):
+            for a, w in up_edges[v]:
+                targets.append(a)
+                weights.append(w)
+            offsets.append(len(targets))
+        # Only keep the middle nodes of shortcuts that ended up in the index (both directions)
+        kept = {}
+        for v in range(n):
+            for a, _ in up_edges[v]:
+                if (v, a) in middle:
+                    kept[(v, a)] = kept[(a, v)] = middle[(v, a)]
+        middle = kept
+        return cls(csr.labels, rank, CSRGraph(csr.labels, offsets, targets, weights), middle)
+
+    # Number of index edges and shortcuts, and the index size in bytes once saved as arrays
+    def size(self):
+        arrays = self._arrays()
+        return len(self.up.targets), len(self.middle), sum(a.nbytes for a in arrays.values())
+
+    def _arrays(self):
+        keys = np.array(list(self.middle.keys()), dtype=np.int64).reshape(-1, 2)
+        return {
+            "labels": np.array(self.labels),
+            "rank": np.array(self.rank, dtype=np.int64),
+            "offsets": np.array(self.up.offsets, dtype=np.int64),
+            "targets": np.array(self.up.targets, dtype=np.int64),
+            "weights": np.array(self.up.weights),
+            "middle_keys": keys,
+            "middle_values": np.array(list(self.middle.values()), dtype=np.int64),
+        }
+
+    def save(self, path):
+        np.savez(path, **self._arrays())
+
+    @classmethod
+    def load(cls, path):
+        data = np.load(path)
+        labels = data["labels"].tolist()
+        up = CSRGraph(labels, data["offsets"].tolist(), data["targets"].tolist(), data["weights"].tolist())
+        middle = dict(zip(map(tuple, data["middle_keys"].tolist()), data["middle_values"].tolist()))
+        return cls(labels, data["rank"].tolist(), up, middle)
+
+    # Bidirectional upward search; returns (distance, [node ids...]) with shortcuts unpacked
+    def query(self, source, target):
+        if source == target:
+            return 0, [source]
+        up = self.up
+        searches = [({source: 0}, {source: -1}, [(0, source)]), ({target: 0}, {target: -1}, [(0, target)])]
+        best = float('inf')
+        meeting = -1
+
+        # Both searches only climb the hierarchy; stop once neither frontier can beat the best meeting
+        while any(heap and heap[0][0] < best for _, _, heap in searches):
+            for side, (dist, pred, heap) in enumerate(searches):
+                if not heap or heap[0][0] >= best:
+                    continue
+                other_dist = searches[1 - side][0]
+                d, u = heapq.heappop(heap)
+                if d != dist[u]:
+                    continue
+                for k in range(up.offsets[u], up.offsets[u + 1]):
+                    v = up.targets[k]
+                    new_distance = d + up.weights[k]
+                    if new_distance < dist.get(v, float('inf')):
+                        dist[v] = new_distance
+                        pred[v] = u
+                        heapq.heappush(heap, (new_distance, v))
+                        if v in other_dist and new_distance + other_dist[v] < best:
+                            best, meeting = new_distance + other_dist[v], v
+
+        if meeting == -1:
+            return float('inf'), []
+
+        forward_pred, backward_pred = searches[0][1], searches[1][1]
+        upward = [meeting]
+        while forward_pred[upward[-1]] != -1:
+            upward.append(forward_pred[upward[-1]])
+        upward.reverse()
+        while backward_pred[upward[-1]] != -1:
+            upward.append(backward_pred[upward[-1]])
+        return best, self._unpack(upward)
+
+    def _unpack(self, path):
+        result = [path[0]]
+        stack = [(a, b) for a, b in reversed(list(zip(path, path[1:])))]
+        while stack:
+            a, b = stack.pop()
+            mid = self.middle.get((a, b))
+            if mid is None:
+                result.append(b)
+            else:
+                stack.append((mid, b))
+                stack.append((a, mid))
+        return result
+
+# Function to time a CH index against plain Dijkstra on random point-to-point queries
+def benchmark_contraction_hierarchy(csr, num_queries=100, seed=None):
+    start = time.perf_counter()
+    index = ContractionHierarchy.build(csr)
+    preprocessing = time.perf_counter() - start
+
+    rng = random.Random(seed)
+    n = len(csr.offsets) - 1
+    pairs = [(rng.randrange(n), rng.randrange(n)) for _ in range(num_queries)]
+
+    start = time.perf_counter()
+    for source, target in pairs:
+        index.query(source, target)
+    ch_latency = (time.perf_counter() - start) / num_queries
+
+    start = time.perf_counter()
+    for source, target in pairs:
+        shortest_path_tree(csr, source)
+    dijkstra_latency = (time.perf_counter() - start) / num_queries
+
+    edges, shortcuts, size = index.size()
+    return index, {
+        "preprocessing": preprocessing,
+        "index_edges": edges,
+        "shortcuts": shortcuts,
+        "index_bytes": size,
+        "ch_latency": ch_latency,
+        "dijkstra_latency": dijkstra_latency,
+    }
+
 # Function to plot the graph with shortest paths highlighted
-def plot_graph(graph, paths, start_node, title):
-    pos = nx.spring_layout(graph, seed=42)
+# k_paths, if given, is a list of label paths drawn on top in one colour each
+def plot_graph(graph, paths, start_node, title, k_paths=None):
+    # Geometric instances carry their own coordinates
+    pos = nx.get_node_attributes(graph, 'pos') or nx.spring_layout(graph, seed=42)
     
     # Identify edges in the shortest paths and color them red
     edges_in_paths = [(u, v) for path in paths.values() for u, v in zip(path, path[1:])]
@@ -64,7 +921,15 @@ def plot_graph(graph, paths, start_node, title):
     
     plt.figure(figsize=(10, 6))
     nx.draw(graph, pos, with_labels=True, node_color=node_colors, edge_color=edge_colors, node_size=500, font_size=10)
-    nx.draw_networkx_edge_labels(graph, pos, edge_labels={(u, v): f"{d['weight']}" for u, v, d in graph.edges(data=True)})
+    nx.draw_networkx_edge_labels(graph, pos, edge_labels={(u, v): f"{d['weight']:.4g}" for u, v, d in graph.edges(data=True)})
+
+    if k_paths:
+        palette = plt.get_cmap("tab10")
+        # Draw the best path last so it stays on top
+        for rank in reversed(range(len(k_paths))):
+            path = k_paths[rank]
+            nx.draw_networkx_edges(graph, pos, edgelist=list(zip(path, path[1:])),
+                                   edge_color=[palette(rank % 10)], width=2 + 2 * (len(k_paths) - rank) / len(k_paths))
 
     plt.title(title)
     return plt.gcf()
@@ -75,7 +940,7 @@ def display_paths_table(distances, paths):
     result += f"{'Destination':<12}{'Path Weight':<10}{'Path'}\n"
     result += "="*40 + "\n"
     for dest, distance in distances.items():
-        result += f"{dest:<12}{distance:<10}{' -> '.join(paths[dest])}\n"
+        result += f"{dest:<12}{distance:<10.6g}{' -> '.join(paths[dest])}\n"
     return result
 
 # Main program
@@ -120,6 +985,27 @@ def mainDijkstra():
     start_node_entry = ttk.Entry(input_frame, width=10, font=("Arial", 14))
     start_node_entry.pack(side=tk.LEFT, padx=5)
 
+    target_frame = ttk.Frame(scrollable_frame)
+    target_frame.pack(pady=5)
+    ttk.Label(target_frame, text="Target node (optional):", font=("Arial", 14)).pack(side=tk.LEFT, padx=5)
+    target_node_entry = ttk.Entry(target_frame, width=10, font=("Arial", 14))
+    target_node_entry.pack(side=tk.LEFT, padx=5)
+    ttk.Label(target_frame, text="K paths:", font=("Arial", 14)).pack(side=tk.LEFT, padx=5)
+    k_paths_entry = ttk.Entry(target_frame, width=5, font=("Arial", 14))
+    k_paths_entry.insert(0, "1")
+    k_paths_entry.pack(side=tk.LEFT, padx=5)
+
+    engine_frame = ttk.Frame(scrollable_frame)
+    engine_frame.pack(pady=5)
+    ttk.Label(engine_frame, text="Engine:", font=("Arial", 14)).pack(side=tk.LEFT, padx=5)
+    engine_choice = ttk.Combobox(engine_frame, values=["Binary heap", "Bucket queue"], state="readonly", width=15)
+    engine_choice.current(0)
+    engine_choice.pack(side=tk.LEFT, padx=5)
+    ttk.Label(engine_frame, text="Instance:", font=("Arial", 14)).pack(side=tk.LEFT, padx=5)
+    instance_choice = ttk.Combobox(engine_frame, values=["Complete random", "Euclidean k-NN"], state="readonly", width=15)
+    instance_choice.current(0)
+    instance_choice.pack(side=tk.LEFT, padx=5)
+
     # Create rounded button
     def create_rounded_button(master, text, command):
         canvas = tk.Canvas(master, width=150, height=40, bg="#F0F0F0", highlightthickness=0)
@@ -173,7 +1059,9 @@ def mainDijkstra():
     button_frame = ttk.Frame(scrollable_frame)
     button_frame.pack(pady=10)
 
-    create_rounded_button(button_frame, "Execute", lambda: execute_dijkstra()).pack()
+    create_rounded_button(button_frame, "Execute", lambda: execute_dijkstra()).pack(side=tk.LEFT, padx=5)
+    create_rounded_button(button_frame, "All Pairs", lambda: execute_all_pairs()).pack(side=tk.LEFT, padx=5)
+    create_rounded_button(button_frame, "CH Index", lambda: execute_ch_query()).pack(side=tk.LEFT, padx=5)
 
     # Frame for graph and results (below the button frame)
     graph_frame = ttk.Frame(scrollable_frame)
@@ -182,37 +1070,257 @@ def mainDijkstra():
     result_label = ttk.Label(graph_frame, text="", font=("Arial", 12), justify="left")
     result_label.pack(pady=10)
 
+    # Entries for what-if edits of a single edge weight on the last graph
+    edit_frame = ttk.Frame(scrollable_frame)
+    edit_frame.pack(pady=5, before=graph_frame)
+    ttk.Label(edit_frame, text="Edge (e.g: X1 X2):", font=("Arial", 12)).pack(side=tk.LEFT, padx=5)
+    edge_entry = ttk.Entry(edit_frame, width=10, font=("Arial", 12))
+    edge_entry.pack(side=tk.LEFT, padx=5)
+    ttk.Label(edit_frame, text="New weight:", font=("Arial", 12)).pack(side=tk.LEFT, padx=5)
+    weight_entry = ttk.Entry(edit_frame, width=6, font=("Arial", 12))
+    weight_entry.pack(side=tk.LEFT, padx=5)
+    create_rounded_button(edit_frame, "Update Edge", lambda: execute_edge_update()).pack(side=tk.LEFT, padx=5)
+
     canvas_graph = None
+    current_graph = None
+    dynamic_tree = None
+    last_result = None  # (start node, distances, paths) of the last single-source run
+    all_pairs_file = None  # Matrix file kept from the last "All Pairs" run
+    ch_index = None  # Contraction hierarchy of current_graph, built on the first "CH Index" query
+    ch_index_file = None  # File the index above is saved to
+
+    # Function to render a figure in the graph frame, replacing the previous one
+    def show_figure(fig):
+        nonlocal canvas_graph
+        if canvas_graph:
+            canvas_graph.get_tk_widget().destroy()
+        canvas_graph = FigureCanvasTkAgg(fig, master=graph_frame)
+        canvas_graph.draw()
+        canvas_graph.get_tk_widget().pack()
 
     # Function to execute the algorithm and render the graph and paths
     def execute_dijkstra():
-        nonlocal canvas_graph
+        nonlocal canvas_graph, current_graph, dynamic_tree, last_result
 
         try:
             num_nodes = int(num_nodes_entry.get())
             start_node = start_node_entry.get()
+            target_node = target_node_entry.get().strip()
             if not start_node.startswith("X") or not start_node[1:].isdigit() or int(start_node[1:]) > num_nodes:
                 raise ValueError("Invalid starting node.")
+            if target_node and (not target_node.startswith("X") or not target_node[1:].isdigit() or int(target_node[1:]) > num_nodes):
+                raise ValueError("Invalid target node.")
             
-            graph = generate_graph(num_nodes)
-            distances, paths = dijkstra(graph, start_node)
+            k_paths = int(k_paths_entry.get() or 1)
+            if k_paths < 1:
+                raise ValueError("K must be at least 1.")
+
+            euclidean = instance_choice.get() == "Euclidean k-NN"
+            if engine_choice.get() == "Bucket queue" and not euclidean and num_nodes > LARGE_GRAPH_NODES:
+                if k_paths > 1:
+                    raise ValueError(f"K shortest paths are limited to {LARGE_GRAPH_NODES} nodes.")
+                execute_large(num_nodes, start_node, target_node)
+                return
+
+            graph = generate_euclidean_graph(num_nodes) if euclidean else generate_graph(num_nodes)
+            current_graph = graph
+            dynamic_tree = None
+            last_result = None
+            remove_ch_index()
+
+            k_shortest = None
+            if target_node and k_paths > 1:
+                k_shortest = yen_k_shortest_paths(graph, start_node, target_node, k_paths)
+                paths = {}
+                result = f"\n{len(k_shortest)} shortest paths from {start_node} to {target_node}:\n"
+                for rank, (cost, path) in enumerate(k_shortest, start=1):
+                    result += f"{rank:<4}{cost:<8.6g}{' -> '.join(path)}\n"
+            elif target_node and euclidean:
+                distance, path, expanded, dijkstra_expanded = astar_query(graph, start_node, target_node)
+                paths = {target_node: path}
+                result = (f"\nDistance from {start_node} to {target_node}: {distance:.2f}\n"
+                          f"Path: {' -> '.join(path)}\n"
+                          f"Nodes explored: A* {expanded}, Dijkstra {dijkstra_expanded} of {num_nodes}\n")
+            elif target_node:
+                distance, path, settled = shortest_path_query(graph, start_node, target_node)
+                paths = {target_node: path}
+                result = (f"\nDistance from {start_node} to {target_node}: {distance}\n"
+                          f"Path: {' -> '.join(path)}\n"
+                          f"Settled nodes: {settled} of {num_nodes}\n")
+            else:
+                if engine_choice.get() == "Bucket queue":
+                    distances, paths = dijkstra_fast(graph, start_node)
+                else:
+                    distances, paths = dijkstra(graph, start_node)
+                last_result = (start_node, distances, paths)
+                result = display_paths_table(distances, paths)
 
             # Plot and render the graph
-            fig = plot_graph(graph, paths, start_node, title="Graph with Shortest Paths Highlighted")
+            fig = plot_graph(graph, paths, start_node, title="Graph with Shortest Paths Highlighted",
+                             k_paths=[path for _, path in k_shortest] if k_shortest else None)
+            show_figure(fig)
+            result_label.config(text=result)
+        except ValueError as e:
+            messagebox.showerror("Input Error", str(e))
 
-            if canvas_graph:
-                canvas_graph.get_tk_widget().destroy()
+    # Function to solve a large instance generated straight into CSR arrays: no networkx graph
+    # is built and nothing is drawn, so only a summary is shown
+    def execute_large(num_nodes, start_node, target_node):
+        nonlocal canvas_graph, current_graph, dynamic_tree, last_result
+        csr = generate_csr_graph(num_nodes)
+        current_graph = None
+        dynamic_tree = None
+        last_result = None
+        remove_ch_index()
+        if canvas_graph:
+            canvas_graph.get_tk_widget().destroy()
+            canvas_graph = None
+
+        result = (f"\nSparse random graph: {num_nodes} nodes, {len(csr.targets) // 2} edges "
+                  f"(not drawn above {LARGE_GRAPH_NODES} nodes)\n")
+        start = time.perf_counter()
+        if target_node:
+            distance, path, settled = shortest_path_query(csr, start_node, target_node)
+            result += (f"Distance from {start_node} to {target_node}: {distance:.6g}\n"
+                       f"Path: {' -> '.join(path)}\n"
+                       f"Settled nodes: {settled} of {num_nodes}\n")
+        else:
+            distances, paths = dijkstra_fast(csr, start_node)
+            reached = {node: d for node, d in distances.items() if d != float('inf')}
+            farthest = max(reached, key=reached.get)
+            result += (f"Reached nodes: {len(reached)} of {num_nodes}\n"
+                       f"Farthest node: {farthest} at distance {reached[farthest]:.6g} "
+                       f"({len(paths[farthest]) - 1} edges)\n")
+        result += f"Execution time: {time.perf_counter() - start:.4f} seconds\n"
+        result_label.config(text=result)
+
+    # Function to change one edge weight and repair the last shortest-path tree
+    def execute_edge_update():
+        nonlocal dynamic_tree
+        try:
+            if dynamic_tree is None and last_result is None:
+                raise ValueError("Run a single-source execution first.")
+            endpoints = edge_entry.get().split()
+            if len(endpoints) != 2:
+                raise ValueError("Enter the edge as two node names, e.g: X1 X2.")
+            node1, node2 = endpoints
+            new_weight = int(weight_entry.get())
+            if not current_graph.has_edge(node1, node2):
+                raise ValueError(f"There is no edge between {node1} and {node2}.")
 
-            canvas_graph = FigureCanvasTkAgg(fig, master=graph_frame)
-            canvas_graph.draw()
-            canvas_graph.get_tk_widget().pack()
+            # The repairable tree is only built on the first edit, from the result already shown
+            if dynamic_tree is None:
+                csr = graph_to_csr(current_graph)
+                start_node, distances, paths = last_result
+                dynamic_tree = DynamicShortestPaths(csr, start_node, paths_to_tree(csr, distances, paths))
+            touched = dynamic_tree.update_edge(node1, node2, new_weight)
+            current_graph[node1][node2]['weight'] = new_weight
+            # The index was contracted with the old weight
+            remove_ch_index()
+            distances, paths = dynamic_tree.result()
+            start_node = dynamic_tree.csr.labels[dynamic_tree.source]
 
+            show_figure(plot_graph(current_graph, paths, start_node, title="Graph with Shortest Paths Highlighted"))
             result = display_paths_table(distances, paths)
+            result += f"\nEdge {node1}-{node2} set to {new_weight}: repair touched {touched} node(s)\n"
             result_label.config(text=result)
         except ValueError as e:
             messagebox.showerror("Input Error", str(e))
 
+    # Function to compute the all-pairs distance matrix of the last graph
+    def execute_all_pairs():
+        nonlocal all_pairs_file
+        if current_graph is None:
+            messagebox.showerror("Input Error", "Run an execution first to generate a graph.")
+            return
+        # Only the last matrix file is kept
+        remove_all_pairs_file()
+        labels, matrix = all_pairs_distances(current_graph)
+        num_nodes = len(labels)
+        if num_nodes <= 15:
+            result = display_distance_matrix(labels, matrix)
+            path = matrix.filename
+            del matrix
+            os.remove(path)
+        else:
+            all_pairs_file = matrix.filename
+            result = f"\nAll-pairs distance matrix ({num_nodes} x {num_nodes}) written to:\n{matrix.filename}\n"
+        result_label.config(text=result)
+
+    # Function to delete the matrix file of the last "All Pairs" run
+    def remove_all_pairs_file():
+        nonlocal all_pairs_file
+        if all_pairs_file and os.path.exists(all_pairs_file):
+            os.remove(all_pairs_file)
+        all_pairs_file = None
+
+    # Function to drop the CH index of the last graph and delete its file
+    def remove_ch_index():
+        nonlocal ch_index, ch_index_file
+        if ch_index_file and os.path.exists(ch_index_file):
+            os.remove(ch_index_file)
+        ch_index = None
+        ch_index_file = None
+
+    def on_close():
+        remove_all_pairs_file()
+        remove_ch_index()
+        root.destroy()
+
+    # Function to answer a start/target query on the last graph through its contraction-hierarchy
+    # index; the index is built (and timed against Dijkstra) only on the first query for that graph
+    def execute_ch_query():
+        nonlocal ch_index, ch_index_file
+        if current_graph is None:
+            messagebox.showerror("Input Error", "Run an execution first to generate a graph.")
+            return
+        # Contraction only pays off on road-like graphs; on the complete random instance every
+        # contraction creates shortcuts between all remaining neighbours and preprocessing takes minutes
+        if not nx.get_node_attributes(current_graph, 'pos'):
+            messagebox.showerror("Input Error", "The CH index needs the Euclidean k-NN instance: "
+                                                "run an execution with that instance type first.")
+            return
+        start_node = start_node_entry.get().strip()
+        target_node = target_node_entry.get().strip()
+        if start_node not in current_graph or (target_node and target_node not in current_graph):
+            messagebox.showerror("Input Error", "Enter a starting node (and optionally a target node) of the last graph.")
+            return
+
+        result = ""
+        if ch_index is None:
+            index, report = benchmark_contraction_hierarchy(graph_to_csr(current_graph))
+            handle, path = tempfile.mkstemp(suffix=".npz")
+            os.close(handle)
+            index.save(path)
+            ch_index, ch_index_file = index, path
+            result += (f"\nContraction hierarchy index (saved to {path}):\n"
+                       f"Preprocessing time: {report['preprocessing']:.4f} seconds\n"
+                       f"Index size: {report['index_edges']} edges, {report['shortcuts']} shortcuts, "
+                       f"{report['index_bytes'] / 1024:.1f} KiB\n"
+                       f"Query latency (CH): {report['ch_latency'] * 1000:.3f} ms\n"
+                       f"Query latency (Dijkstra): {report['dijkstra_latency'] * 1000:.3f} ms\n")
+        else:
+            result += f"\nContraction hierarchy index reused from {ch_index_file}\n"
+
+        if target_node:
+            labels = ch_index.labels
+            start = time.perf_counter()
+            distance, path = ch_index.query(labels.index(start_node), labels.index(target_node))
+            elapsed = time.perf_counter() - start
+            path = [labels[i] for i in path]
+            if path:
+                show_figure(plot_graph(current_graph, {target_node: path}, start_node,
+                                       title="Shortest Path from the CH Index"))
+                result += (f"\nDistance from {start_node} to {target_node}: {distance:.6g}\n"
+                           f"Path: {' -> '.join(path)}\n")
+            else:
+                result += f"\nNo path from {start_node} to {target_node}\n"
+            result += f"CH query time: {elapsed * 1000:.3f} ms\n"
+        result_label.config(text=result)
+
+    root.protocol("WM_DELETE_WINDOW", on_close)
     root.mainloop()
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     mainDijkstra()
\ No newline at end of file
@@ -1,4 +1,9 @@
+import os
 import random
+import time
+import multiprocessing
+from array import array
+import numpy as np
 import networkx as nx
 import matplotlib.pyplot as plt
 from collections import deque
@@ -16,52 +21,486 @@ def generate_random_graph(num_vertices, max_capacity=10):
                 G.add_edge(i, j, capacity=capacity)
     return G
 
-# Breadth-first search for augmenting path
-def bfs(capacity, flow, source, sink):
-    parent = [-1] * len(capacity)
-    parent[source] = -2
-    queue = deque([(source, float('inf'))])
-    while queue:
-        u, min_cap = queue.popleft()
-        for v in range(len(capacity)):
-            if parent[v] == -1 and capacity[u][v] - flow[u][v] > 0:
-                parent[v] = u
-                new_flow = min(min_cap, capacity[u][v] - flow[u][v])
-                if v == sink:
-                    return new_flow, parent
-                queue.append((v, new_flow))
-    return 0, parent
+# Function to generate a dense capacity matrix as int32 (every ordered pair, no self-loops)
+def generate_capacity_matrix(num_vertices, max_capacity=10, seed=None):
+    rng = np.random.default_rng(seed)
+    capacity = rng.integers(1, max_capacity + 1, size=(num_vertices, num_vertices), dtype=np.int32)
+    np.fill_diagonal(capacity, 0)
+    return capacity
 
-# Ford-Fulkerson algorithm for max flow
-def ford_fulkerson(capacity, source, sink):
-    n = len(capacity)
-    flow = [[0] * n for _ in range(n)]
+# Function to generate a sparse network straight into int32 CSR arrays (offsets, targets, capacities),
+# with about out_degree distinct arcs leaving each vertex
+def generate_sparse_network(num_vertices, out_degree=4, max_capacity=10, seed=None):
+    rng = np.random.default_rng(seed)
+    tails = np.repeat(np.arange(num_vertices, dtype=np.int64), out_degree)
+    heads = rng.integers(0, num_vertices, size=tails.size)
+    keys = np.unique(tails[tails != heads] * num_vertices + heads[tails != heads])
+    tails, heads = keys // num_vertices, keys % num_vertices
+    offsets = np.zeros(num_vertices + 1, dtype=np.int32)
+    np.cumsum(np.bincount(tails, minlength=num_vertices), out=offsets[1:])
+    capacities = rng.integers(1, max_capacity + 1, size=heads.size, dtype=np.int32)
+    return offsets, heads.astype(np.int32), capacities
+
+# Larger networks are solved but not drawn
+MAX_DRAWN_VERTICES = 60
+
+# Residual network stored in int32 arrays. Edges come in pairs: e is u -> v and e ^ 1 is
+# v -> u, with flow[e] == -flow[e ^ 1], so the residual of e is cap[e] - flow[e].
+# The edges leaving u are edges[offsets[u]:offsets[u + 1]] (CSR adjacency)
+class ResidualGraph:
+    def __init__(self, num_vertices):
+        self.n = num_vertices
+        self.to = array('i')
+        self.cap = array('i')
+        self.flow = array('i')
+        self._adjacency = None
+
+    # Function to add u -> v (and its paired v -> u, which may carry its own capacity)
+    def add_edge(self, u, v, capacity, reverse_capacity=0):
+        e = len(self.to)
+        self.to.extend((v, u))
+        self.cap.extend((capacity, reverse_capacity))
+        self.flow.extend((0, 0))
+        self._adjacency = None
+        return e
+
+    # Function to build a residual network from paired arc arrays (one pair per u -> v)
+    @classmethod
+    def _from_pairs(cls, num_vertices, tails, heads, capacity, reverse_capacity, by_neighbour=False):
+        residual = cls(num_vertices)
+        pairs = len(tails)
+        to = np.empty(2 * pairs, dtype=np.int32)
+        to[0::2], to[1::2] = heads, tails
+        cap = np.empty(2 * pairs, dtype=np.int32)
+        cap[0::2], cap[1::2] = capacity, reverse_capacity
+        residual.to = array('i', to.tobytes())
+        residual.cap = array('i', cap.tobytes())
+        residual.flow = array('i', bytes(4 * 2 * pairs))
+        residual._build_adjacency(to, by_neighbour)
+        return residual
+
+    # Function to build the residual network of a dense capacity matrix; neighbours end up
+    # in increasing order, so searches visit them exactly like a row scan of the matrix
+    @classmethod
+    def from_matrix(cls, capacity):
+        capacity = np.asarray(capacity, dtype=np.int32)
+        tails, heads = np.nonzero(np.triu((capacity > 0) | (capacity.T > 0), 1))
+        return cls._from_pairs(len(capacity), tails, heads, capacity[tails, heads], capacity[heads, tails], True)
+
+    # Function to build the residual network of a CSR arc list (offsets, targets, capacities)
+    @classmethod
+    def from_csr(cls, offsets, targets, capacities):
+        num_vertices = len(offsets) - 1
+        tails = np.repeat(np.arange(num_vertices, dtype=np.int32), np.diff(offsets))
+        return cls._from_pairs(num_vertices, tails, targets, capacities, 0)
+
+    def _build_adjacency(self, to=None, by_neighbour=False):
+        to = np.frombuffer(self.to, dtype=np.int32) if to is None else to
+        tails = to.reshape(-1, 2)[:, ::-1].ravel()
+        order = np.lexsort((to, tails)) if by_neighbour else np.argsort(tails, kind="stable")
+        offsets = np.zeros(self.n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(tails, minlength=self.n), out=offsets[1:])
+        self._adjacency = (offsets.tolist(), array('i', order.astype(np.int32).tobytes()))
+
+    # (offsets, edges) CSR adjacency, rebuilt after add_edge calls
+    def adjacency(self):
+        if self._adjacency is None:
+            self._build_adjacency()
+        return self._adjacency
+
+    # Breadth-first search for a shortest augmenting path; returns (bottleneck, parent edge ids)
+    def bfs(self, source, sink):
+        offsets, edges = self.adjacency()
+        to, cap, flow = self.to, self.cap, self.flow
+        parent = [-1] * self.n
+        parent[source] = -2
+        queue = deque([(source, float('inf'))])
+        while queue:
+            u, min_cap = queue.popleft()
+            for e in edges[offsets[u]:offsets[u + 1]]:
+                v = to[e]
+                if parent[v] == -1 and cap[e] - flow[e] > 0:
+                    parent[v] = e
+                    new_flow = min(min_cap, cap[e] - flow[e])
+                    if v == sink:
+                        return new_flow, parent
+                    queue.append((v, new_flow))
+        return 0, parent
+
+    # Function to push `amount` along the path recorded in `parent` (sink back to source)
+    def augment(self, parent, source, sink, amount):
+        v = sink
+        while v != source:
+            e = parent[v]
+            self.flow[e] += amount
+            self.flow[e ^ 1] -= amount
+            v = self.to[e ^ 1]
+
+    # Source side of the minimum cut: vertices still reachable in the residual network
+    def min_cut(self, source):
+        offsets, edges = self.adjacency()
+        visited = [False] * self.n
+        queue = deque([source])
+        visited[source] = True
+        while queue:
+            u = queue.popleft()
+            for e in edges[offsets[u]:offsets[u + 1]]:
+                v = self.to[e]
+                if self.cap[e] - self.flow[e] > 0 and not visited[v]:
+                    visited[v] = True
+                    queue.append(v)
+        return visited
+
+    # Net flow leaving `source` (the flow value once the flow is valid)
+    def flow_value(self, source):
+        offsets, edges = self.adjacency()
+        return sum(self.flow[e] for e in edges[offsets[source]:offsets[source + 1]])
+
+    # Function to find the arc u -> v (-1 if none), preferring one that carries capacity
+    def find_edge(self, u, v):
+        offsets, edges = self.adjacency()
+        found = -1
+        for e in edges[offsets[u]:offsets[u + 1]]:
+            if self.to[e] == v:
+                if self.cap[e] > 0:
+                    return e
+                if found == -1:
+                    found = e
+        return found
+
+    # Dense n x n net flow matrix (only meant for small networks)
+    def flow_matrix(self):
+        flow = [[0] * self.n for _ in range(self.n)]
+        for e in range(len(self.to)):
+            flow[self.to[e ^ 1]][self.to[e]] += self.flow[e]
+        return flow
+
+# Edmonds-Karp on a residual network; returns the max flow value and operation counts
+def edmonds_karp(residual, source, sink):
     max_flow = 0
+    augmentations = 0
     while True:
-        path_flow, parent = bfs(capacity, flow, source, sink)
+        path_flow, parent = residual.bfs(source, sink)
         if path_flow == 0:
             break
+        residual.augment(parent, source, sink, path_flow)
         max_flow += path_flow
-        v = sink
-        while v != source:
-            u = parent[v]
-            flow[u][v] += path_flow
-            flow[v][u] -= path_flow
-            v = u
-    return max_flow, flow
+        augmentations += 1
+    return max_flow, {"augmentations": augmentations}
+
+# Dinic: BFS level graph, then a blocking flow found by DFS with current-arc pointers
+def dinic(residual, source, sink):
+    offsets, edges = residual.adjacency()
+    to, cap, flow = residual.to, residual.cap, residual.flow
+    n = residual.n
+    max_flow = 0
+    phases = 0
+    augmentations = 0
+
+    while True:
+        level = [-1] * n
+        level[source] = 0
+        queue = deque([source])
+        while queue:
+            u = queue.popleft()
+            # Vertices at or beyond the sink's level cannot be on a shortest augmenting path
+            if level[sink] != -1 and level[u] >= level[sink]:
+                break
+            for e in edges[offsets[u]:offsets[u + 1]]:
+                v = to[e]
+                if level[v] == -1 and cap[e] - flow[e] > 0:
+                    level[v] = level[u] + 1
+                    queue.append(v)
+        if level[sink] == -1:
+            break
+        phases += 1
+
+        pointer = offsets[:-1]
+        path = []
+        u = source
+        while True:
+            if u == sink:
+                amount = min(cap[e] - flow[e] for e in path)
+                for e in path:
+                    flow[e] += amount
+                    flow[e ^ 1] -= amount
+                max_flow += amount
+                augmentations += 1
+                path = []
+                u = source
+                continue
+            # Advance along the current arc of u, skipping arcs that are saturated or not level-increasing
+            end = offsets[u + 1]
+            while pointer[u] < end:
+                e = edges[pointer[u]]
+                if cap[e] - flow[e] > 0 and level[to[e]] == level[u] + 1:
+                    break
+                pointer[u] += 1
+            if pointer[u] < end:
+                e = edges[pointer[u]]
+                path.append(e)
+                u = to[e]
+            elif u == source:
+                break
+            else:
+                # Dead end: retreat and drop the arc that led here
+                level[u] = -1
+                e = path.pop()
+                u = to[e ^ 1]
+                pointer[u] += 1
+
+    return max_flow, {"phases": phases, "augmentations": augmentations}
+
+# Highest-label push-relabel with the gap heuristic. It runs until no vertex has excess,
+# so the result is a proper flow and min_cut() gives the same cut as the other engines
+def push_relabel(residual, source, sink):
+    offsets, edges = residual.adjacency()
+    to, cap, flow = residual.to, residual.cap, residual.flow
+    n = residual.n
+    height = [0] * n
+    excess = [0] * n
+    count = [0] * (2 * n + 2)
+    buckets = [[] for _ in range(2 * n + 2)]
+    pointer = offsets[:-1]
+    height[source] = n
+    count[0] = n - 1
+    count[n] = 1
+    pushes = 0
+    relabels = 0
+
+    # Saturate every arc leaving the source
+    for e in edges[offsets[source]:offsets[source + 1]]:
+        amount = cap[e] - flow[e]
+        if amount > 0:
+            v = to[e]
+            flow[e] += amount
+            flow[e ^ 1] -= amount
+            excess[source] -= amount
+            excess[v] += amount
+            if v != sink and excess[v] == amount:
+                buckets[0].append(v)
+    highest = 0
+
+    while highest >= 0:
+        if not buckets[highest]:
+            highest -= 1
+            continue
+        u = buckets[highest].pop()
+        if excess[u] <= 0 or height[u] != highest:
+            continue
+
+        # Discharge u completely
+        while excess[u] > 0:
+            if pointer[u] == offsets[u + 1]:
+                old_height = height[u]
+                new_height = min(height[to[e]] for e in edges[offsets[u]:offsets[u + 1]] if cap[e] - flow[e] > 0) + 1
+                count[old_height] -= 1
+                height[u] = new_height
+                count[new_height] += 1
+                pointer[u] = offsets[u]
+                relabels += 1
+                # Gap: nothing left at old_height, so everything between it and n is cut off from the sink
+                if count[old_height] == 0 and old_height < n:
+                    for v in range(n):
+                        if old_height < height[v] < n:
+                            count[height[v]] -= 1
+                            height[v] = n + 1
+                            count[n + 1] += 1
+                            pointer[v] = offsets[v]
+                            if excess[v] > 0 and v != u:
+                                buckets[n + 1].append(v)
+                                highest = max(highest, n + 1)
+                continue
+            e = edges[pointer[u]]
+            v = to[e]
+            residual_capacity = cap[e] - flow[e]
+            if residual_capacity > 0 and height[u] == height[v] + 1:
+                amount = min(excess[u], residual_capacity)
+                flow[e] += amount
+                flow[e ^ 1] -= amount
+                excess[u] -= amount
+                excess[v] += amount
+                pushes += 1
+                if v != source and v != sink and excess[v] == amount:
+                    buckets[height[v]].append(v)
+                    # u may have been relabelled above the level it was taken from
+                    highest = max(highest, height[v])
+            else:
+                pointer[u] += 1
+
+    return excess[sink], {"pushes": pushes, "relabels": relabels}
+
+# Function to push up to `limit` units from a to b along shortest residual paths
+def _augment_up_to(residual, a, b, limit):
+    pushed = 0
+    augmentations = 0
+    while pushed < limit:
+        path_flow, parent = residual.bfs(a, b)
+        if path_flow == 0:
+            break
+        amount = min(path_flow, limit - pushed)
+        residual.augment(parent, a, b, amount)
+        pushed += amount
+        augmentations += 1
+    return pushed, augmentations
+
+# Warm-started re-solve after changing the capacity of arc u -> v. The current flow is kept:
+# an increase simply resumes augmenting; a decrease below the arc's flow first reroutes the
+# excess from u to v, then sends whatever cannot be rerouted back to the source (from u) and
+# back from the sink (to v) before resuming. A missing arc is added. Returns (max_flow, operation counts)
+def change_capacity(residual, u, v, new_capacity, source, sink):
+    if new_capacity < 0:
+        raise ValueError("Capacities must be non-negative.")
+    e = residual.find_edge(u, v)
+    if e == -1:
+        e = residual.add_edge(u, v, 0)
+    augmentations = 0
+    excess = residual.flow[e] - new_capacity
+    residual.cap[e] = new_capacity
+
+    if excess > 0:
+        residual.flow[e] -= excess
+        residual.flow[e ^ 1] += excess
+        rerouted, count = _augment_up_to(residual, u, v, excess)
+        augmentations += count
+        remaining = excess - rerouted
+        if remaining > 0:
+            # u now receives more than it sends and v sends more than it receives
+            if u != source:
+                _, count = _augment_up_to(residual, u, source, remaining)
+                augmentations += count
+            if v != sink:
+                _, count = _augment_up_to(residual, sink, v, remaining)
+                augmentations += count
+
+    _, stats = edmonds_karp(residual, source, sink)
+    augmentations += stats["augmentations"]
+    return residual.flow_value(source), {"augmentations": augmentations}
+
+# Function to count the augmentations a cold start would need on the same capacities
+def cold_start_augmentations(residual, source, sink):
+    cold = ResidualGraph(residual.n)
+    cold.to, cold.cap = residual.to, array('i', residual.cap)
+    cold.flow = array('i', bytes(4 * len(residual.to)))
+    cold._adjacency = residual.adjacency()
+    _, stats = edmonds_karp(cold, source, sink)
+    return stats["augmentations"]
+
+# Max-flow engines selectable from the window; each returns (max_flow, operation counts)
+MAX_FLOW_ENGINES = {
+    "Edmonds-Karp": edmonds_karp,
+    "Dinic": dinic,
+    "Push-relabel": push_relabel,
+}
+
+# Worker state for the Gomory-Hu pool: one symmetric network shared by every cut computation
+_cut_network = None
+
+def _init_cut_worker(network):
+    global _cut_network
+    _cut_network = network
+
+# Function to compute one s-t minimum cut on a fresh copy of the shared network
+def _min_cut_task(pair):
+    source, sink = pair
+    residual = ResidualGraph(_cut_network.n)
+    residual.to, residual.cap = _cut_network.to, _cut_network.cap
+    residual.flow = array('i', bytes(4 * len(_cut_network.to)))
+    residual._adjacency = _cut_network.adjacency()
+    value, _ = dinic(residual, source, sink)
+    return source, sink, value, residual.min_cut(source)
+
+# Gomory-Hu cut tree (Gusfield's algorithm) of the network with every arc treated as undirected,
+# i.e. the capacity between u and v is c(u, v) + c(v, u). Returns (parent, cut_value, stats):
+# vertex i > 0 hangs below parent[i] through a tree edge of weight cut_value[i].
+# The n - 1 cuts are computed speculatively in batches over a process pool: a result is kept only
+# if the parent it was computed against is still current when its turn comes.
+# stats counts every max-flow actually computed ("flow_calls") and how many were thrown away ("discarded")
+def gomory_hu_tree(residual, processes=None):
+    n = residual.n
+    symmetric = ResidualGraph(n)
+    symmetric.to = residual.to
+    symmetric.cap = array('i', (residual.cap[e] + residual.cap[e ^ 1] for e in range(len(residual.cap))))
+    symmetric._adjacency = residual.adjacency()
+
+    parent = [0] * n
+    parent[0] = -1
+    cut_value = [0] * n
+    flow_calls = 0
+    discarded = 0
+
+    # Gusfield's update: vertices on v's side that hung below t now hang below v
+    def attach(v, t, value, side):
+        for i in range(n):
+            if i != v and side[i] and parent[i] == t:
+                parent[i] = v
+        cut_value[v] = value
+        if parent[t] != -1 and side[parent[t]]:
+            parent[v] = parent[t]
+            parent[t] = v
+            cut_value[v] = cut_value[t]
+            cut_value[t] = value
+
+    if processes == 1:
+        # Serial: each sink is read from the live tree, so exactly n - 1 flows are computed
+        _init_cut_worker(symmetric)
+        for v in range(1, n):
+            _, t, value, side = _min_cut_task((v, parent[v]))
+            flow_calls += 1
+            attach(v, t, value, side)
+        return parent, cut_value, {"flow_calls": flow_calls, "discarded": discarded}
+
+    pool = multiprocessing.Pool(processes, _init_cut_worker, (symmetric,))
+    batch_size = 4 * (processes or os.cpu_count() or 1)
+    try:
+        s = 1
+        while s < n:
+            # The sinks are snapshotted for the whole batch; a result whose sink has moved since is
+            # stale, and it and the rest of the batch are recomputed from the updated tree
+            batch = [(v, parent[v]) for v in range(s, min(n, s + batch_size))]
+            results = pool.map(_min_cut_task, batch)
+            flow_calls += len(results)
+            kept = 0
+            for v, t, value, side in results:
+                if parent[v] != t:
+                    break
+                kept += 1
+                attach(v, t, value, side)
+                s = v + 1
+            discarded += len(batch) - kept
+    finally:
+        pool.close()
+        pool.join()
+    return parent, cut_value, {"flow_calls": flow_calls, "discarded": discarded}
+
+# Function to read the minimum u-v cut off a Gomory-Hu tree: the lightest edge on the tree path
+def tree_min_cut(parent, cut_value, u, v):
+    if u == v:
+        return float('inf')
+    ancestors = {}
+    x, best = u, float('inf')
+    while x != -1:
+        ancestors[x] = best
+        best = min(best, cut_value[x]) if parent[x] != -1 else best
+        x = parent[x]
+    x, best = v, float('inf')
+    while x not in ancestors:
+        best = min(best, cut_value[x])
+        x = parent[x]
+    return min(best, ancestors[x])
+
+# Ford-Fulkerson algorithm for max flow
+def ford_fulkerson(capacity, source, sink):
+    residual = ResidualGraph.from_matrix(capacity)
+    max_flow, _ = edmonds_karp(residual, source, sink)
+    return max_flow, residual.flow_matrix()
 
 # Find minimum cut using BFS
 def find_min_cut(capacity, flow, source):
-    visited = [False] * len(capacity)
-    queue = deque([source])
-    visited[source] = True
-    while queue:
-        u = queue.popleft()
-        for v in range(len(capacity)):
-            if capacity[u][v] - flow[u][v] > 0 and not visited[v]:
-                visited[v] = True
-                queue.append(v)
-    return visited
+    residual = ResidualGraph.from_matrix(capacity)
+    for e in range(len(residual.to)):
+        residual.flow[e] = flow[residual.to[e ^ 1]][residual.to[e]]
+    return residual.min_cut(source)
 
 # Draw graph with min cut
 def draw_graph_with_cut(G, min_cut):
@@ -109,36 +548,62 @@ def fulkerson():
     num_vertices_entry = ttk.Entry(input_frame, width=10, font=("Arial", 14))
     num_vertices_entry.pack(side=tk.LEFT, padx=5)
 
+    ttk.Label(input_frame, text="Out-degree (optional):", font=("Arial", 14)).pack(side=tk.LEFT, padx=5)
+    out_degree_entry = ttk.Entry(input_frame, width=6, font=("Arial", 14))
+    out_degree_entry.pack(side=tk.LEFT, padx=5)
+
+    ttk.Label(input_frame, text="Engine:", font=("Arial", 14)).pack(side=tk.LEFT, padx=5)
+    engine_choice = ttk.Combobox(input_frame, values=list(MAX_FLOW_ENGINES), state="readonly", width=14)
+    engine_choice.current(0)
+    engine_choice.pack(side=tk.LEFT, padx=5)
+
     def run_algorithm():
         try:
             num_vertices = int(num_vertices_entry.get())
             if num_vertices < 2:
                 raise ValueError("The number of vertices must be at least 2.")
             
-            # Generate the graph
-            G = generate_random_graph(num_vertices)
+            out_degree = out_degree_entry.get().strip()
             
             # Define source and sink
             source = 0
             sink = num_vertices - 1
             
-            # Create capacity matrix
-            capacity = [[0] * num_vertices for _ in range(num_vertices)]
-            for u, v, data in G.edges(data=True):
-                capacity[u][v] = data['capacity']
+            # Generate the capacities straight into int32 arrays (dense matrix or sparse CSR)
+            start_time = time.perf_counter()
+            if out_degree:
+                offsets, targets, capacities = generate_sparse_network(num_vertices, int(out_degree))
+                residual = ResidualGraph.from_csr(offsets, targets, capacities)
+            else:
+                residual = ResidualGraph.from_matrix(generate_capacity_matrix(num_vertices))
+            generation_time = time.perf_counter() - start_time
+            run_algorithm.residual = residual
             
-            # Calculate max flow
-            max_flow, flow = ford_fulkerson(capacity, source, sink)
+            # Calculate max flow on the residual network with the selected engine
+            start_time = time.perf_counter()
+            max_flow, stats = MAX_FLOW_ENGINES[engine_choice.get()](residual, source, sink)
+            solve_time = time.perf_counter() - start_time
+            run_algorithm.tree = None
             
             # Find minimum cut
-            min_cut = find_min_cut(capacity, flow, source)
+            min_cut = residual.min_cut(source)
             
             # Clear previous results (destroy previous graph if exists)
             if hasattr(run_algorithm, 'canvas_graph'):
                 run_algorithm.canvas_graph.get_tk_widget().destroy()
             
             # Show results in a message box
-            result_label.config(text=f"Maximum Flow: {max_flow}")
+            counts = ", ".join(f"{name}: {value}" for name, value in stats.items())
+            result_label.config(text=f"Maximum Flow: {max_flow}\n{engine_choice.get()} - {counts}\n"
+                                     f"Generation time: {generation_time:.4f} seconds\n"
+                                     f"Solve time: {solve_time:.4f} seconds")
+            
+            # Only small networks are worth drawing
+            if num_vertices > MAX_DRAWN_VERTICES:
+                return
+            G = nx.DiGraph()
+            G.add_nodes_from(range(num_vertices))
+            G.add_edges_from((residual.to[e ^ 1], residual.to[e]) for e in range(len(residual.to)) if residual.cap[e] > 0)
             
             # Draw the graph with the min cut
             fig = plt.figure(figsize=(8, 8))
@@ -205,6 +670,85 @@ def fulkerson():
     # Button to run the algorithm
     create_rounded_button(scrollable_frame, "Run Algorithm", run_algorithm).pack(pady=20)
 
+    # Gomory-Hu cut tree of the last network, and min-cut queries answered from it
+    def show_cut_tree():
+        if not hasattr(run_algorithm, 'residual'):
+            messagebox.showerror("Invalid Input", "Run the algorithm first to generate a network.")
+            return
+        residual = run_algorithm.residual
+        start_time = time.perf_counter()
+        parent, cut_value, stats = gomory_hu_tree(residual)
+        tree_time = time.perf_counter() - start_time
+        run_algorithm.tree = (parent, cut_value)
+        result_label.config(text=f"Gomory-Hu tree: {stats['flow_calls']} max-flow computations "
+                                 f"({stats['discarded']} discarded as stale) in {tree_time:.4f} seconds")
+
+        if hasattr(run_algorithm, 'canvas_graph'):
+            run_algorithm.canvas_graph.get_tk_widget().destroy()
+            del run_algorithm.canvas_graph
+        if residual.n > MAX_DRAWN_VERTICES:
+            return
+        T = nx.Graph()
+        T.add_nodes_from(range(residual.n))
+        T.add_weighted_edges_from((v, parent[v], cut_value[v]) for v in range(1, residual.n))
+        fig = plt.figure(figsize=(8, 8))
+        pos = nx.spring_layout(T, seed=42)
+        nx.draw(T, pos, with_labels=True, node_color='lightblue', node_size=500, font_size=16, font_weight='bold')
+        nx.draw_networkx_edge_labels(T, pos, edge_labels=nx.get_edge_attributes(T, 'weight'))
+        run_algorithm.canvas_graph = FigureCanvasTkAgg(fig, master=scrollable_frame)
+        run_algorithm.canvas_graph.draw()
+        run_algorithm.canvas_graph.get_tk_widget().pack()
+
+    def query_cut():
+        try:
+            if not getattr(run_algorithm, 'tree', None):
+                raise ValueError("Build the Gomory-Hu tree first.")
+            u, v = map(int, pair_entry.get().split())
+            parent, cut_value = run_algorithm.tree
+            if not (0 <= u < len(parent) and 0 <= v < len(parent)) or u == v:
+                raise ValueError("Enter two different vertices of the network.")
+            result_label.config(text=f"Minimum cut between {u} and {v}: {tree_min_cut(parent, cut_value, u, v)}")
+        except ValueError as e:
+            messagebox.showerror("Invalid Input", str(e))
+
+    # Capacity what-if: change one arc and re-solve from the current flow
+    def update_capacity():
+        try:
+            if not hasattr(run_algorithm, 'residual'):
+                raise ValueError("Run the algorithm first to generate a network.")
+            residual = run_algorithm.residual
+            u, v = map(int, arc_entry.get().split())
+            new_capacity = int(capacity_entry.get())
+            if not (0 <= u < residual.n and 0 <= v < residual.n) or u == v:
+                raise ValueError("Enter two different vertices of the network.")
+            source, sink = 0, residual.n - 1
+            max_flow, stats = change_capacity(residual, u, v, new_capacity, source, sink)
+            cold = cold_start_augmentations(residual, source, sink)
+            run_algorithm.tree = None
+            result_label.config(text=f"Capacity of {u} -> {v} set to {new_capacity}\nMaximum Flow: {max_flow}\n"
+                                     f"Warm re-solve: {stats['augmentations']} augmentations "
+                                     f"(cold start: {cold})")
+        except ValueError as e:
+            messagebox.showerror("Invalid Input", str(e))
+
+    capacity_frame = ttk.Frame(scrollable_frame)
+    capacity_frame.pack(pady=5)
+    ttk.Label(capacity_frame, text="Arc (u v):", font=("Arial", 12)).pack(side=tk.LEFT, padx=5)
+    arc_entry = ttk.Entry(capacity_frame, width=10, font=("Arial", 12))
+    arc_entry.pack(side=tk.LEFT, padx=5)
+    ttk.Label(capacity_frame, text="New capacity:", font=("Arial", 12)).pack(side=tk.LEFT, padx=5)
+    capacity_entry = ttk.Entry(capacity_frame, width=6, font=("Arial", 12))
+    capacity_entry.pack(side=tk.LEFT, padx=5)
+    create_rounded_button(capacity_frame, "Update Capacity", update_capacity).pack(side=tk.LEFT, padx=5)
+
+    tree_frame = ttk.Frame(scrollable_frame)
+    tree_frame.pack(pady=5)
+    create_rounded_button(tree_frame, "Gomory-Hu Tree", show_cut_tree).pack(side=tk.LEFT, padx=5)
+    ttk.Label(tree_frame, text="Vertices (u v):", font=("Arial", 12)).pack(side=tk.LEFT, padx=5)
+    pair_entry = ttk.Entry(tree_frame, width=10, font=("Arial", 12))
+    pair_entry.pack(side=tk.LEFT, padx=5)
+    create_rounded_button(tree_frame, "Min Cut", query_cut).pack(side=tk.LEFT, padx=5)
+
     # Label to display results
     result_label = ttk.Label(scrollable_frame, text="", font=("Arial", 12))
     result_label.pack(pady=10)
@@ -212,4 +756,5 @@ def fulkerson():
     root.mainloop()
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     fulkerson()
\ No newline at end of file
@@ -1,6 +1,14 @@
+import os  # To count the available processors
+import sys  # For the headless entry point
+import argparse  # Command-line options of the headless entry point
+import tempfile  # Sorted runs of the external-memory mode
 import string  # To manipulate strings
+import multiprocessing  # For the parallel Boruvka engine
 import random  # To generate random values
 import time  # To measure execution time
+import heapq  # For the lazy partial sort
+from array import array  # Compact edge buckets
+import numpy as np  # For edge arrays and sorting
 import matplotlib.pyplot as plt  # To plot graphs
 import networkx as nx  # To create and visualize graphs
 import tkinter as tk
@@ -20,26 +28,44 @@ def creer_labels_noeuds(nombre_noeuds):
         labels.append(label)
     return labels
 
-# Function to create a graph with random weights between 1 and 99
-def creer_graphe(nombre_noeuds):
-    noeuds = creer_labels_noeuds(nombre_noeuds)
-    liens = []
+# Function to yield the edges of the complete graph one at a time (weights between 1 and 99)
+def generer_liens(noeuds):
+    nombre_noeuds = len(noeuds)
     for i in range(nombre_noeuds):
         for j in range(i + 1, nombre_noeuds):
             poids = random.randint(1, 99)
-            liens.append((noeuds[i], noeuds[j], poids))
-    return noeuds, liens
+            yield (noeuds[i], noeuds[j], poids)
 
-# Class to manage disjoint sets (Union-Find)
+# Function to create a graph with random weights between 1 and 99
+def creer_graphe(nombre_noeuds):
+    noeuds = creer_labels_noeuds(nombre_noeuds)
+    return noeuds, list(generer_liens(noeuds))
+
+# Function to create the same complete graph as integer endpoint and weight arrays
+def creer_graphe_tableaux(nombre_noeuds, seed=None):
+    rng = np.random.default_rng(seed)
+    sources, cibles = np.triu_indices(nombre_noeuds, k=1)
+    poids = rng.integers(1, 100, size=sources.size, dtype=np.int32)
+    return creer_labels_noeuds(nombre_noeuds), sources.astype(np.int32), cibles.astype(np.int32), poids
+
+# Class to manage disjoint sets (Union-Find), iterative with path halving so long chains
+# never hit the recursion limit. compact=True stores parents in an int32 array and ranks in
+# bytes (a rank never exceeds log2(n)): 5 bytes per node instead of two lists of Python ints
 class GestionEnsemble:
-    def __init__(self, nombre_noeuds):
-        self.parent = list(range(nombre_noeuds))
-        self.hauteur = [0] * nombre_noeuds
+    def __init__(self, nombre_noeuds, compact=False):
+        if compact:
+            self.parent = array('i', range(nombre_noeuds))
+            self.hauteur = bytearray(nombre_noeuds)
+        else:
+            self.parent = list(range(nombre_noeuds))
+            self.hauteur = [0] * nombre_noeuds
 
     def trouver_chef(self, noeud):
-        if self.parent[noeud] != noeud:
-            self.parent[noeud] = self.trouver_chef(self.parent[noeud])
-        return self.parent[noeud]
+        parent = self.parent
+        while parent[noeud] != noeud:
+            parent[noeud] = parent[parent[noeud]]
+            noeud = parent[noeud]
+        return noeud
 
     def fusionner(self, noeud1, noeud2):
         chef1 = self.trouver_chef(noeud1)
@@ -52,42 +78,522 @@ class GestionEnsemble:
             else:
                 self.parent[chef2] = chef1
                 self.hauteur[chef1] += 1
+        return chef1 != chef2
+
+# Kruskal on integer arrays: stable argsort of the weights, then edges are scanned in blocks
+# until n - 1 are accepted. Returns the indices of the MST edges and the total cost
+def kruskal_tableaux(nombre_noeuds, sources, cibles, poids, taille_bloc=65536, ordre=None):
+    if ordre is None:
+        ordre = np.argsort(poids, kind="stable")
+    gestion_ensemble = GestionEnsemble(nombre_noeuds)
+    choisis = []
+    cout_total = 0
+
+    for debut in range(0, ordre.size, taille_bloc):
+        if len(choisis) >= nombre_noeuds - 1:
+            break
+        bloc = ordre[debut:debut + taille_bloc]
+        for i, noeud1, noeud2, p in zip(bloc.tolist(), sources[bloc].tolist(), cibles[bloc].tolist(), poids[bloc].tolist()):
+            if gestion_ensemble.fusionner(noeud1, noeud2):
+                choisis.append(i)
+                cout_total += p
+                if len(choisis) == nombre_noeuds - 1:
+                    break
+
+    return choisis, cout_total
+
+# Kruskal over a lazy stream of (label, label, poids) edges with a partial sort: edges are
+# only ordered as far as needed to accept n - 1 of them. With integer weights in
+# [0, poids_max] they go into per-weight buckets of compact endpoint arrays; otherwise into
+# a heap of compact (poids, edge number) entries, with the endpoints kept in an int array,
+# that is popped lazily. Returns (acm, cout_total, number of edges examined)
+def kruskal_paresseux(noeuds, flux_liens, poids_max=None):
+    index = {noeud: i for i, noeud in enumerate(noeuds)}
+    if poids_max is not None:
+        seaux = [array('i') for _ in range(poids_max + 1)]
+        for noeud1, noeud2, poids in flux_liens:
+            seaux[poids].extend((index[noeud1], index[noeud2]))
+        ordonnes = ((noeuds[seau[k]], noeuds[seau[k + 1]], poids)
+                    for poids, seau in enumerate(seaux) for k in range(0, len(seau), 2))
+    else:
+        extremites = array('i')
+        tas = []
+        for k, (noeud1, noeud2, poids) in enumerate(flux_liens):
+            extremites.extend((index[noeud1], index[noeud2]))
+            tas.append((poids, k))
+        heapq.heapify(tas)
+
+        def depiler():
+            while tas:
+                poids, k = heapq.heappop(tas)
+                yield noeuds[extremites[2 * k]], noeuds[extremites[2 * k + 1]], poids
+        ordonnes = depiler()
 
-# Kruskal's algorithm to find the minimum spanning tree
-def algorithme_kruskal(noeuds, liens):
-    liens_tries = sorted(liens, key=lambda x: x[2])
     gestion_ensemble = GestionEnsemble(len(noeuds))
     acm = []
     cout_total = 0
-
-    for lien in liens_tries:
+    examines = 0
+    if len(noeuds) < 2:
+        return acm, cout_total, examines
+    for lien in ordonnes:
+        examines += 1
         noeud1, noeud2, poids = lien
-        index1 = noeuds.index(noeud1)
-        index2 = noeuds.index(noeud2)
-        if gestion_ensemble.trouver_chef(index1) != gestion_ensemble.trouver_chef(index2):
-            gestion_ensemble.fusionner(index1, index2)
+        if gestion_ensemble.fusionner(index[noeud1], index[noeud2]):
             acm.append(lien)
             cout_total += poids
-        if len(acm) == len(noeuds) - 1:
-            break
+            if len(acm) == len(noeuds) - 1:
+                break
+    return acm, cout_total, examines
+
+# Function to build the dense symmetric weight matrix (INFINI where there is no edge)
+INFINI = np.iinfo(np.int32).max
+
+def matrice_poids(nombre_noeuds, sources, cibles, poids):
+    matrice = np.full((nombre_noeuds, nombre_noeuds), INFINI, dtype=np.int32)
+    matrice[sources, cibles] = poids
+    matrice[cibles, sources] = poids
+    return matrice
+
+# Prim in O(n^2) for dense graphs: a key vector of the cheapest link to the tree is updated
+# with one vectorized comparison per added node (no heap). Returns [(u, v, poids), ...], cost
+def prim_dense(matrice):
+    nombre_noeuds = len(matrice)
+    arbre = []
+    cout_total = 0
+    if nombre_noeuds == 0:
+        return arbre, cout_total
+    dans_arbre = np.zeros(nombre_noeuds, dtype=bool)
+    cle = matrice[0].astype(np.int64)
+    parent = np.zeros(nombre_noeuds, dtype=np.int64)
+    dans_arbre[0] = True
+    cle[0] = INFINI
+
+    for _ in range(nombre_noeuds - 1):
+        noeud = int(np.argmin(cle))
+        if cle[noeud] >= INFINI:
+            break  # Remaining nodes are not connected to the tree
+        arbre.append((int(parent[noeud]), noeud, int(cle[noeud])))
+        cout_total += int(cle[noeud])
+        dans_arbre[noeud] = True
+        cle[noeud] = INFINI
+        ligne = matrice[noeud]
+        mieux = (ligne < cle) & ~dans_arbre
+        cle[mieux] = ligne[mieux]
+        parent[mieux] = noeud
+
+    return arbre, cout_total
+
+# Worker state for Boruvka: the edge arrays are sent once per worker
+_aretes_boruvka = None
+
+def _init_boruvka(sources, cibles, poids):
+    global _aretes_boruvka
+    _aretes_boruvka = (sources, cibles, poids)
+
+# Function to find, for one slice of the edges, the cheapest edge leaving each component.
+# Edges are compared on (poids, index) so every component picks a unique minimum
+def _minimums_locaux(tache):
+    debut, fin, composante = tache
+    sources, cibles, poids = (a[debut:fin] for a in _aretes_boruvka)
+    nombre_aretes = len(_aretes_boruvka[0])
+    cle = poids.astype(np.int64) * nombre_aretes + np.arange(debut, fin)
+    c1, c2 = composante[sources], composante[cibles]
+    sortante = c1 != c2
+    meilleur = np.full(len(composante), np.iinfo(np.int64).max)
+    np.minimum.at(meilleur, c1[sortante], cle[sortante])
+    np.minimum.at(meilleur, c2[sortante], cle[sortante])
+    return meilleur
+
+# Boruvka: each round every component picks its cheapest outgoing edge; the search over
+# the edge list is split across worker processes. Returns [(u, v, poids), ...], cost
+def boruvka_parallele(nombre_noeuds, sources, cibles, poids, processus=None):
+    processus = processus or os.cpu_count() or 1
+    gestion_ensemble = GestionEnsemble(nombre_noeuds)
+    nombre_aretes = len(sources)
+    bornes = np.linspace(0, nombre_aretes, processus + 1).astype(np.int64).tolist()
+    arbre = []
+    cout_total = 0
+
+    with multiprocessing.Pool(processus, _init_boruvka, (sources, cibles, poids)) as pool:
+        while len(arbre) < nombre_noeuds - 1:
+            composante = np.array([gestion_ensemble.trouver_chef(i) for i in range(nombre_noeuds)], dtype=np.int64)
+            taches = [(bornes[i], bornes[i + 1], composante) for i in range(processus)]
+            meilleur = np.minimum.reduce(pool.map(_minimums_locaux, taches))
+            trouvees = np.unique(meilleur[meilleur != np.iinfo(np.int64).max] % nombre_aretes)
+            if trouvees.size == 0:
+                break  # The graph is not connected
+            for i in trouvees.tolist():
+                if gestion_ensemble.fusionner(int(sources[i]), int(cibles[i])):
+                    arbre.append((int(sources[i]), int(cibles[i]), int(poids[i])))
+                    cout_total += int(poids[i])
+
+    return arbre, cout_total
+
+# MST engines for the window; each returns ([(u, v, poids), ...], cost, {phase: seconds})
+def moteur_kruskal(nombre_noeuds, sources, cibles, poids):
+    debut = time.perf_counter()
+    ordre = np.argsort(poids, kind="stable")
+    tri = time.perf_counter()
+    choisis, cout_total = kruskal_tableaux(nombre_noeuds, sources, cibles, poids, ordre=ordre)
+    fin = time.perf_counter()
+    arbre = [(int(sources[i]), int(cibles[i]), int(poids[i])) for i in choisis]
+    return arbre, cout_total, {"Sort": tri - debut, "Union-find scan": fin - tri}
+
+def moteur_prim(nombre_noeuds, sources, cibles, poids):
+    debut = time.perf_counter()
+    matrice = matrice_poids(nombre_noeuds, sources, cibles, poids)
+    construction = time.perf_counter()
+    arbre, cout_total = prim_dense(matrice)
+    fin = time.perf_counter()
+    return arbre, cout_total, {"Weight matrix": construction - debut, "Prim": fin - construction}
+
+def moteur_boruvka(nombre_noeuds, sources, cibles, poids):
+    debut = time.perf_counter()
+    arbre, cout_total = boruvka_parallele(nombre_noeuds, sources, cibles, poids)
+    return arbre, cout_total, {"Boruvka rounds": time.perf_counter() - debut}
+
+# Function to stream the edges of the arrays one block at a time, so at most taille_bloc
+# edges are ever converted to Python objects
+def flux_tableaux(sources, cibles, poids, taille_bloc=65536):
+    for debut in range(0, len(sources), taille_bloc):
+        fin = debut + taille_bloc
+        yield from zip(sources[debut:fin].tolist(), cibles[debut:fin].tolist(), poids[debut:fin].tolist())
+
+def moteur_kruskal_paresseux(nombre_noeuds, sources, cibles, poids):
+    debut = time.perf_counter()
+    flux = flux_tableaux(sources, cibles, poids)
+    acm, cout_total, examines = kruskal_paresseux(list(range(nombre_noeuds)), flux, poids_max=99)
+    return acm, cout_total, {"Bucket partial sort": time.perf_counter() - debut, "Edges examined": examines}
+
+MOTEURS_ACM = {
+    "Kruskal": moteur_kruskal,
+    "Kruskal (lazy stream)": moteur_kruskal_paresseux,
+    "Prim (dense)": moteur_prim,
+    "Boruvka (parallel)": moteur_boruvka,
+}
+
+# Minimum spanning tree kept up to date under edge insertions and weight changes.
+# A new or cheaper edge swaps out the heaviest edge on the tree path between its endpoints;
+# a costlier tree edge is cut and the cheapest edge reconnecting the two sides replaces it
+class ACMDynamique:
+    def __init__(self, nombre_noeuds, sources, cibles, poids, arbre=None):
+        self.voisins = [{} for _ in range(nombre_noeuds)]
+        for u, v, p in zip(sources.tolist(), cibles.tolist(), poids.tolist()):
+            self.voisins[u][v] = p
+            self.voisins[v][u] = p
+        if arbre is None:
+            choisis, _ = kruskal_tableaux(nombre_noeuds, sources, cibles, poids)
+            arbre = [(int(sources[i]), int(cibles[i]), poids[i].item()) for i in choisis]
+        self.arbre = [{} for _ in range(nombre_noeuds)]
+        self.cout_total = 0
+        for u, v, p in arbre:
+            self._ajouter(u, v, p)
+
+    def _ajouter(self, u, v, poids):
+        self.arbre[u][v] = poids
+        self.arbre[v][u] = poids
+        self.cout_total += poids
+
+    def _retirer(self, u, v):
+        poids = self.arbre[u].pop(v)
+        del self.arbre[v][u]
+        self.cout_total -= poids
+        return poids
+
+    # Function to list the tree edges on the path from u to v (None if they are not connected)
+    def _chemin(self, u, v):
+        parent = {u: None}
+        pile = [u]
+        while pile and v not in parent:
+            x = pile.pop()
+            for y in self.arbre[x]:
+                if y not in parent:
+                    parent[y] = x
+                    pile.append(y)
+        if v not in parent:
+            return None
+        chemin = []
+        while parent[v] is not None:
+            chemin.append((parent[v], v))
+            v = parent[v]
+        return chemin
+
+    # Function to return the smaller of the two tree components holding u and v, exploring
+    # both in lockstep so the cost is bounded by the smaller side
+    def _plus_petit_cote(self, u, v):
+        cotes = ({u}, {v})
+        piles = ([u], [v])
+        while True:
+            for cote, pile in zip(cotes, piles):
+                if not pile:
+                    return cote
+                x = pile.pop()
+                for y in self.arbre[x]:
+                    if y not in cote:
+                        cote.add(y)
+                        pile.append(y)
+
+    # Function to insert edge (u, v) or change its weight.
+    # Returns (removed tree edge, added tree edge), each (u, v, poids) or None
+    def modifier_lien(self, u, v, poids):
+        ancien = self.voisins[u].get(v)
+        self.voisins[u][v] = poids
+        self.voisins[v][u] = poids
 
-    return acm, cout_total
+        if v in self.arbre[u]:
+            self._retirer(u, v)
+            if poids <= ancien:
+                self._ajouter(u, v, poids)
+                return None, None
+            # Only edges leaving the smaller side can reconnect the tree
+            cote = self._plus_petit_cote(u, v)
+            meilleur = min((p, x, y) for x in cote for y, p in self.voisins[x].items() if y not in cote)
+            p, x, y = meilleur
+            self._ajouter(x, y, p)
+            if {x, y} == {u, v}:
+                return None, None
+            return (u, v, poids), (x, y, p)
+
+        if ancien is not None and poids >= ancien:
+            return None, None
+        chemin = self._chemin(u, v)
+        if chemin is None:
+            self._ajouter(u, v, poids)
+            return None, (u, v, poids)
+        a, b = max(chemin, key=lambda lien: self.arbre[lien[0]][lien[1]])
+        if self.arbre[a][b] <= poids:
+            return None, None
+        retire = (a, b, self._retirer(a, b))
+        self._ajouter(u, v, poids)
+        return retire, (u, v, poids)
+
+    # Function to list the tree edges as (u, v, poids) with u < v
+    def aretes(self):
+        return [(u, v, p) for u, voisins in enumerate(self.arbre) for v, p in voisins.items() if u < v]
+
+# Binary record of an edge file used by the external-memory mode
+TYPE_ARETE = np.dtype([("u", "<i4"), ("v", "<i4"), ("poids", "<f8")])
+
+# Function to write a random complete graph to an edge file, one row of edges at a time
+def generer_fichier_aretes(chemin, nombre_noeuds, seed=None):
+    rng = np.random.default_rng(seed)
+    with open(chemin, "wb") as fichier:
+        for i in range(nombre_noeuds - 1):
+            bloc = np.empty(nombre_noeuds - i - 1, dtype=TYPE_ARETE)
+            bloc["u"] = i
+            bloc["v"] = np.arange(i + 1, nombre_noeuds)
+            bloc["poids"] = rng.integers(1, 100, size=bloc.size)
+            bloc.tofile(fichier)
+
+# Memory held per node while merging: compact union-find (int32 parent + byte rank) and
+# one tree record
+OCTETS_PAR_NOEUD = 4 + 1 + TYPE_ARETE.itemsize
+
+# Most runs merged at once: bounds the open files and read buffers of one merge step
+FUSION_MAX = 64
+
+# Function to read the next block of a run; returns (block, run exhausted)
+def _lire_bloc(fichier, taille):
+    bloc = np.fromfile(fichier, dtype=TYPE_ARETE, count=taille)
+    return bloc, bloc.size < taille
+
+# Function to merge sorted run files, yielding sorted lots of records. Records on disk are never
+# lighter than the last record buffered for their run, so everything up to the smallest such
+# weight is safe to emit and each lot is one vectorized stable sort of the buffered prefixes
+def _fusionner_runs(fichiers, par_run):
+    tampons = []
+    epuises = []
+    for fichier in fichiers:
+        bloc, epuise = _lire_bloc(fichier, par_run)
+        tampons.append(bloc)
+        epuises.append(epuise)
+
+    while any(t.size for t in tampons):
+        limites = [t["poids"][-1] for t, epuise in zip(tampons, epuises) if t.size and not epuise]
+        seuil = min(limites) if limites else np.inf
+        coupes = [np.searchsorted(t["poids"], seuil, side="right") for t in tampons]
+        lot = np.concatenate([t[:c] for t, c in zip(tampons, coupes)])
+        yield lot[np.argsort(lot["poids"], kind="stable")]
+
+        for i, (t, c) in enumerate(zip(tampons, coupes)):
+            tampons[i] = t[c:]
+            if tampons[i].size == 0 and not epuises[i]:
+                tampons[i], epuises[i] = _lire_bloc(fichiers[i], par_run)
+
+# External-memory Kruskal for edge files larger than RAM:
+# 1. the file is read in chunks that fit the memory budget, each chunk is sorted by weight
+#    and written to a temporary run file;
+# 2. while there are more than FUSION_MAX runs, groups of FUSION_MAX runs are merged into
+#    longer runs on disk, so a merge never holds more than FUSION_MAX files and buffers;
+# 3. the last runs are merged and the stream feeds an array-backed union-find that stops
+#    after n - 1 edges.
+# Buffer sizes are derived from the budget alone; the union-find and the tree records
+# (OCTETS_PAR_NOEUD per node) come out of it during the final merge. When nombre_noeuds is not
+# given it is found while sorting the runs. A MemoryError is raised if the budget cannot hold
+# one record per buffer.
+# progression(phase, fraction) is called as the work advances.
+# Returns (tree edges as a TYPE_ARETE array, cost, number of edges examined)
+def kruskal_externe(chemin, budget_octets=256 * 2**20, dossier_temp=None, progression=None, nombre_noeuds=None):
+    progression = progression or (lambda phase, fraction: None)
+    total = os.path.getsize(chemin) // TYPE_ARETE.itemsize
+
+    # Number of records per buffer when each buffered record costs octets_par_enregistrement
+    def taille_tampon(noeuds, octets_par_enregistrement):
+        taille = (budget_octets - OCTETS_PAR_NOEUD * noeuds) // octets_par_enregistrement
+        if taille < 1:
+            raise MemoryError(f"A budget of {budget_octets} bytes is too small: the union-find and tree of "
+                              f"{noeuds} nodes plus one record per buffer ({octets_par_enregistrement} bytes) do not fit.")
+        return taille
+
+    # A chunk, its sorted copy and the argsort indices must fit together in the budget
+    par_bloc = taille_tampon(nombre_noeuds or 0, 3 * TYPE_ARETE.itemsize)
+    noeuds_vus = 0
+    runs = []
+
+    with tempfile.TemporaryDirectory(dir=dossier_temp) as dossier:
+        lus = 0
+        with open(chemin, "rb") as fichier:
+            while True:
+                bloc = np.fromfile(fichier, dtype=TYPE_ARETE, count=par_bloc)
+                if bloc.size == 0:
+                    break
+                noeuds_vus = max(noeuds_vus, int(max(bloc["u"].max(), bloc["v"].max())) + 1)
+                run = os.path.join(dossier, f"run{len(runs)}.bin")
+                bloc[np.argsort(bloc["poids"], kind="stable")].tofile(run)
+                runs.append(run)
+                lus += bloc.size
+                progression("Sorting runs", lus / total)
+        nombre_noeuds = max(nombre_noeuds or 0, noeuds_vus)
+
+        # While merging, the buffers, the lot built from them, its sorted copy and the argsort
+        # indices must fit together: under 4 records per buffered record
+        passe = 0
+        while len(runs) > FUSION_MAX:
+            passe += 1
+            par_run = taille_tampon(0, 4 * TYPE_ARETE.itemsize * FUSION_MAX)
+            fusionnes = []
+            for debut in range(0, len(runs), FUSION_MAX):
+                groupe = runs[debut:debut + FUSION_MAX]
+                sortie = os.path.join(dossier, f"pass{passe}_run{len(fusionnes)}.bin")
+                fichiers = [open(run, "rb") for run in groupe]
+                try:
+                    with open(sortie, "wb") as fichier:
+                        for lot in _fusionner_runs(fichiers, par_run):
+                            lot.tofile(fichier)
+                finally:
+                    for fichier in fichiers:
+                        fichier.close()
+                for run in groupe:
+                    os.remove(run)
+                fusionnes.append(sortie)
+                progression(f"Merging runs (pass {passe})", min(1.0, (debut + FUSION_MAX) / len(runs)))
+            runs = fusionnes
+
+        par_run = taille_tampon(nombre_noeuds, 4 * TYPE_ARETE.itemsize * max(1, len(runs)))
+        gestion_ensemble = GestionEnsemble(nombre_noeuds, compact=True)
+        arbre = np.empty(max(0, nombre_noeuds - 1), dtype=TYPE_ARETE)
+        acceptes = 0
+        cout_total = 0
+        examines = 0
+        fichiers = [open(run, "rb") for run in runs]
+        try:
+            for lot in _fusionner_runs(fichiers, par_run):
+                for u, v, poids in zip(lot["u"].tolist(), lot["v"].tolist(), lot["poids"].tolist()):
+                    examines += 1
+                    if gestion_ensemble.fusionner(u, v):
+                        arbre[acceptes] = (u, v, poids)
+                        acceptes += 1
+                        cout_total += poids
+                        if acceptes == nombre_noeuds - 1:
+                            break
+                progression("Merging runs", examines / total)
+                if acceptes == nombre_noeuds - 1:
+                    break
+        finally:
+            for fichier in fichiers:
+                fichier.close()
+
+    return arbre[:acceptes], cout_total, examines
+
+# Headless entry point: python kruskal.py EDGE_FILE [--memory MiB] [--output FILE] [--generate N]
+def main_externe(arguments):
+    parser = argparse.ArgumentParser(description="External-memory Kruskal over a binary edge file "
+                                                 "(records: int32 u, int32 v, float64 weight).")
+    parser.add_argument("fichier", help="edge file")
+    parser.add_argument("--memory", type=int, default=256, help="memory budget in MiB (default 256)")
+    parser.add_argument("--output", help="write the MST edges to this file (same record format)")
+    parser.add_argument("--generate", type=int, metavar="N", help="first write a random complete graph on N nodes")
+    options = parser.parse_args(arguments)
+
+    if options.generate:
+        generer_fichier_aretes(options.fichier, options.generate)
+
+    def afficher_progression(phase, fraction):
+        sys.stderr.write(f"\r{phase}: {100 * fraction:5.1f}%")
+        sys.stderr.flush()
+
+    debut = time.time()
+    arbre, cout_total, examines = kruskal_externe(options.fichier, options.memory * 2**20,
+                                                  progression=afficher_progression)
+    sys.stderr.write("\n")
+    print(f"MST edges: {len(arbre)}\nTotal cost of MST: {cout_total:g}\n"
+          f"Edges examined: {examines}\nExecution time: {time.time() - debut:.4f} seconds")
+    if options.output:
+        arbre.tofile(options.output)
+
+# Kruskal's algorithm to find the minimum spanning tree
+def algorithme_kruskal(noeuds, liens):
+    index = {noeud: i for i, noeud in enumerate(noeuds)}
+    sources = np.fromiter((index[lien[0]] for lien in liens), dtype=np.int64, count=len(liens))
+    cibles = np.fromiter((index[lien[1]] for lien in liens), dtype=np.int64, count=len(liens))
+    poids = np.array([lien[2] for lien in liens])
+    choisis, cout_total = kruskal_tableaux(len(noeuds), sources, cibles, poids)
+    return [liens[i] for i in choisis], cout_total
+
+# Graphs with more nodes than this are solved but not drawn
+MAX_NOEUDS_AFFICHES = 60
+
+# Drawing of a graph and its MST that keeps one artist per MST edge and per weight label,
+# so an edge update only touches the artists of the edges that changed
+class DessinACM:
+    def __init__(self, noeuds, liens, acm=None, titre="Graph"):
+        G = nx.Graph()
+        for noeud1, noeud2, poids in liens:
+            G.add_edge(noeud1, noeud2, weight=poids)
+        self.positions = nx.spring_layout(G, seed=42)
+        self.figure = plt.figure(figsize=(10, 7))
+        nx.draw(G, self.positions, with_labels=True, node_color='lightblue', node_size=500, font_size=10,
+                font_weight='bold', edge_color='gray')
+        etiquettes = nx.draw_networkx_edge_labels(G, self.positions, edge_labels={(noeud1, noeud2): f'{poids}' for noeud1, noeud2, poids in liens})
+        self.etiquettes = {frozenset(lien): texte for lien, texte in etiquettes.items()}
+        self.traits = {}
+        for noeud1, noeud2, _ in acm or ():
+            self._tracer(noeud1, noeud2, color='blue', linewidth=3)
+        plt.title(titre)
+
+    def _tracer(self, noeud1, noeud2, **style):
+        (x1, y1), (x2, y2) = self.positions[noeud1], self.positions[noeud2]
+        self.traits[frozenset((noeud1, noeud2))], = self.figure.gca().plot([x1, x2], [y1, y2], zorder=1.5, **style)
+
+    # Function to apply the result of ACMDynamique.modifier_lien to the drawing (edges as labels)
+    def appliquer(self, lien, retire=None, ajoute=None):
+        noeud1, noeud2, poids = lien
+        cle = frozenset((noeud1, noeud2))
+        if cle in self.etiquettes:
+            self.etiquettes[cle].set_text(f'{poids}')
+        else:
+            # Inserted edge: draw it in the background with its label
+            (x1, y1), (x2, y2) = self.positions[noeud1], self.positions[noeud2]
+            self.figure.gca().plot([x1, x2], [y1, y2], color='gray', zorder=1)
+            self.etiquettes[cle] = self.figure.gca().text((x1 + x2) / 2, (y1 + y2) / 2, f'{poids}', ha='center', va='center')
+        if retire:
+            self.traits.pop(frozenset(retire[:2])).remove()
+        if ajoute:
+            self._tracer(ajoute[0], ajoute[1], color='blue', linewidth=3)
 
 # Function to display the graph with NetworkX
 def afficher_graphe(noeuds, liens, acm=None, titre="Graph"):
-    G = nx.Graph()
-    for noeud1, noeud2, poids in liens:
-        G.add_edge(noeud1, noeud2, weight=poids)
-    positions = nx.spring_layout(G, seed=42)
-    plt.figure(figsize=(10, 7))
-    nx.draw(G, positions, with_labels=True, node_color='lightblue', node_size=500, font_size=10,
-            font_weight='bold', edge_color='gray')
-    nx.draw_networkx_edge_labels(G, positions, edge_labels={(noeud1, noeud2): f'{poids}' for noeud1, noeud2, poids in liens})
-    if acm:
-        liens_acm = [(noeud1, noeud2) for noeud1, noeud2, _ in acm]
-        nx.draw_networkx_edges(G, positions, edgelist=liens_acm, width=3, edge_color='blue')
-    plt.title(titre)
-    return plt.gcf()
+    return DessinACM(noeuds, liens, acm, titre).figure
 
 # Function to create a rounded rectangle
 def create_rounded_rectangle(canvas, x1, y1, x2, y2, radius=25, **kwargs):
@@ -148,6 +654,12 @@ def kruskal():
     nombre_noeuds_entry.pack(side=tk.LEFT, padx=5)
     nombre_noeuds_entry.insert(0, "5")  # Default value
 
+    # Engine selection
+    ttk.Label(input_frame, text="Engine:", font=("Arial", 14, "bold")).pack(side=tk.LEFT, padx=5)
+    moteur_choix = ttk.Combobox(input_frame, values=list(MOTEURS_ACM), state="readonly", width=18)
+    moteur_choix.current(0)
+    moteur_choix.pack(side=tk.LEFT, padx=5)
+
     def on_enter(e):
         e.widget.itemconfig(e.widget.find_withtag("rect"), fill='#00cccc')
 
@@ -162,17 +674,36 @@ def kruskal():
             return
         
         debut = time.time()
-        noeuds, liens = creer_graphe(nombre_noeuds)
-        fig = afficher_graphe(noeuds, liens, titre="Original Graph")
-        acm, cout_total = algorithme_kruskal(noeuds, liens)
-        fig_acm = afficher_graphe(noeuds, liens, acm, titre="Graph with MST")
-        fin = time.time()
-        temps_execution = fin - debut
-        resultats_text.set(f"Total cost of MST: {cout_total} euros\nExecution time: {temps_execution:.4f} seconds")
+        noeuds, sources, cibles, poids = creer_graphe_tableaux(nombre_noeuds)
+        phases = {"Graph generation": time.time() - debut}
+        arbre, cout_total, phases_moteur = MOTEURS_ACM[moteur_choix.get()](nombre_noeuds, sources, cibles, poids)
+        phases.update(phases_moteur)
 
         # Check if there's an existing canvas, and destroy it if it exists
         if hasattr(executer_kruskal, 'canvas'):
             executer_kruskal.canvas.get_tk_widget().destroy()
+            del executer_kruskal.canvas
+
+        # Keep the instance for edge updates; the dynamic structure is built on the first update
+        executer_kruskal.instance = (noeuds, sources, cibles, poids, arbre)
+        executer_kruskal.dynamique = None
+        executer_kruskal.dessin = None
+
+        # Large graphs stay in arrays and are not drawn
+        if nombre_noeuds <= MAX_NOEUDS_AFFICHES:
+            debut_dessin = time.time()
+            liens = [(noeuds[u], noeuds[v], p) for u, v, p in zip(sources.tolist(), cibles.tolist(), poids.tolist())]
+            acm = [(noeuds[u], noeuds[v], p) for u, v, p in arbre]
+            executer_kruskal.dessin = DessinACM(noeuds, liens, acm, titre="Graph with MST")
+            fig_acm = executer_kruskal.dessin.figure
+            phases["Drawing"] = time.time() - debut_dessin
+
+        temps_execution = time.time() - debut
+        details = "\n".join(f"{phase}: {valeur:.4f} seconds" if isinstance(valeur, float) else f"{phase}: {valeur}"
+                            for phase, valeur in phases.items())
+        resultats_text.set(f"Total cost of MST: {cout_total} euros\n{details}\nExecution time: {temps_execution:.4f} seconds")
+        if nombre_noeuds > MAX_NOEUDS_AFFICHES:
+            return
 
         # Create a new canvas with the updated graph
         executer_kruskal.canvas = FigureCanvasTkAgg(fig_acm, master=scrollable_frame)
@@ -188,6 +719,57 @@ def kruskal():
     button_canvas.bind("<Enter>", lambda e: button_canvas.itemconfig(button_rect, fill='#00cccc'))
     button_canvas.bind("<Leave>", lambda e: button_canvas.itemconfig(button_rect, fill='#008080'))
 
+    # Edge update: insert or re-weight one edge and repair the MST in place
+    def mettre_a_jour_lien():
+        if not hasattr(executer_kruskal, 'instance'):
+            messagebox.showerror("Error", "Execute the algorithm first.")
+            return
+        noeuds, sources, cibles, poids, arbre = executer_kruskal.instance
+        index = {noeud: i for i, noeud in enumerate(noeuds)}
+        try:
+            noeud1, noeud2 = lien_entry.get().upper().split()
+            nouveau_poids = int(poids_entry.get())
+            if noeud1 not in index or noeud2 not in index or noeud1 == noeud2:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Error", "Enter two different node labels (e.g. A B) and an integer weight.")
+            return
+
+        if executer_kruskal.dynamique is None:
+            executer_kruskal.dynamique = ACMDynamique(len(noeuds), sources, cibles, poids, arbre)
+        dynamique = executer_kruskal.dynamique
+        debut = time.perf_counter()
+        retire, ajoute = dynamique.modifier_lien(index[noeud1], index[noeud2], nouveau_poids)
+        duree = time.perf_counter() - debut
+
+        retire = retire and (noeuds[retire[0]], noeuds[retire[1]], retire[2])
+        ajoute = ajoute and (noeuds[ajoute[0]], noeuds[ajoute[1]], ajoute[2])
+        if executer_kruskal.dessin is not None:
+            executer_kruskal.dessin.appliquer((noeud1, noeud2, nouveau_poids), retire, ajoute)
+            executer_kruskal.canvas.draw_idle()
+        if retire:
+            echange = f"Swapped out {retire[0]}-{retire[1]}, in {ajoute[0]}-{ajoute[1]}"
+        else:
+            echange = f"Added {ajoute[0]}-{ajoute[1]}" if ajoute else "Tree unchanged"
+        resultats_text.set(f"Edge {noeud1}-{noeud2} set to {nouveau_poids}\n{echange}\n"
+                           f"Total cost of MST: {dynamique.cout_total} euros\nUpdate time: {duree * 1000:.3f} ms")
+
+    update_frame = ttk.Frame(scrollable_frame)
+    update_frame.pack(pady=5)
+    ttk.Label(update_frame, text="Edge (e.g. A B):", font=("Arial", 12)).pack(side=tk.LEFT, padx=5)
+    lien_entry = ttk.Entry(update_frame, font=("Arial", 12), width=8)
+    lien_entry.pack(side=tk.LEFT, padx=5)
+    ttk.Label(update_frame, text="New weight:", font=("Arial", 12)).pack(side=tk.LEFT, padx=5)
+    poids_entry = ttk.Entry(update_frame, font=("Arial", 12), width=6)
+    poids_entry.pack(side=tk.LEFT, padx=5)
+    update_canvas = tk.Canvas(update_frame, width=140, height=50)
+    update_canvas.pack(side=tk.LEFT, padx=5)
+    update_rect = create_rounded_rectangle(update_canvas, 5, 5, 135, 45, radius=20, fill='#008080', outline='')
+    update_canvas.create_text(70, 25, text="Update Edge", fill='white', font=('Helvetica', 12, 'bold'))
+    update_canvas.bind("<Button-1>", lambda e: mettre_a_jour_lien())
+    update_canvas.bind("<Enter>", lambda e: update_canvas.itemconfig(update_rect, fill='#00cccc'))
+    update_canvas.bind("<Leave>", lambda e: update_canvas.itemconfig(update_rect, fill='#008080'))
+
     # This will now be placed under the button
     resultats_text = tk.StringVar()
 
@@ -198,4 +780,8 @@ def kruskal():
     root.mainloop()
 
 if __name__ == "__main__":
-    kruskal()
+    multiprocessing.freeze_support()
+    if len(sys.argv) > 1:
+        main_externe(sys.argv[1:])
+    else:
+        kruskal()
@@ -1,6 +1,7 @@
 import random
 import tkinter as tk
 from tkinter import ttk, messagebox
+import numpy as np
 
 def generate_random_costs(rows, cols):
     return [[random.randint(1, 20) for _ in range(cols)] for _ in range(rows)]
@@ -25,24 +26,32 @@ def northwest_corner_method(supply, demand, costs):
 def least_cost_method(supply, demand, costs):
     rows, cols = len(supply), len(demand)
     allocation = [[0] * cols for _ in range(rows)]
-    while any(supply) and any(demand):
-        # Find the minimum cost cell
-        min_cost = float('inf')
-        min_i, min_j = -1, -1
-        for i in range(rows):
-            for j in range(cols):
-                if supply[i] > 0 and demand[j] > 0 and costs[i][j] < min_cost:
-                    min_cost = costs[i][j]
-                    min_i, min_j = i, j
+    allocated = []
+    # Sort the cells by cost once (ties in row-major order, like a full scan would pick them)
+    order = np.argsort(np.asarray(costs).ravel(), kind='stable')
+    open_rows = sum(1 for s in supply if s)
+    open_cols = sum(1 for d in demand if d)
+    # Walk that order; a cell is skipped once its row or column is exhausted
+    for cell in order.tolist():
+        if not (open_rows and open_cols):
+            break
+        min_i, min_j = divmod(cell, cols)
+        if supply[min_i] <= 0 or demand[min_j] <= 0:
+            continue
         # Allocate as much as possible to the minimum cost cell
         allocation[min_i][min_j] = min(supply[min_i], demand[min_j])
+        allocated.append((min_i, min_j))
         if supply[min_i] < demand[min_j]:
             demand[min_j] -= supply[min_i]
             supply[min_i] = 0
+            open_rows -= 1
         else:
             supply[min_i] -= demand[min_j]
             demand[min_j] = 0
-    total_cost = sum(allocation[i][j] * costs[i][j] for i in range(rows) for j in range(cols))
+            open_cols -= 1
+            if supply[min_i] == 0:
+                open_rows -= 1
+    total_cost = sum(allocation[i][j] * costs[i][j] for i, j in sorted(allocated))
     return allocation, total_cost
 
 def stepping_stone_method(allocation, costs):
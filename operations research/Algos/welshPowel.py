@@ -1,10 +1,17 @@
 import networkx as nx
 import matplotlib.pyplot as plt
 import random
+import heapq
+import os
+import multiprocessing
+from multiprocessing import shared_memory
+import numpy as np
 from matplotlib import colors as mcolors
+from matplotlib.collections import LineCollection
 import time
 import tkinter as tk
 from tkinter import messagebox
+from tkinter import ttk
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
 
@@ -19,6 +26,133 @@ def generate_random_graph(x):
     return G
 
 
+# Function to generate a sparse random graph as adjacency lists (nodes 0..x-1), for graphs
+# too large for generate_random_graph
+def generate_sparse_adjacency(x, average_degree, seed=None):
+    rng = np.random.default_rng(seed)
+    m = x * average_degree // 2
+    u = rng.integers(0, x, size=m)
+    v = rng.integers(0, x, size=m)
+    keep = u != v
+    keys = np.unique(np.minimum(u[keep], v[keep]) * x + np.maximum(u[keep], v[keep]))
+    adjacency = [[] for _ in range(x)]
+    for a, b in zip((keys // x).tolist(), (keys % x).tolist()):
+        adjacency[a].append(b)
+        adjacency[b].append(a)
+    return adjacency
+
+
+# Function to convert a NetworkX graph to (node list, adjacency lists of node indices)
+def graph_to_adjacency(G):
+    nodes = list(G.nodes())
+    index = {node: i for i, node in enumerate(nodes)}
+    return nodes, [[index[neighbor] for neighbor in G.neighbors(node)] for node in nodes]
+
+
+# Function to build a NetworkX graph from adjacency lists (used for drawing)
+def adjacency_to_graph(adjacency):
+    G = nx.Graph()
+    G.add_nodes_from(range(len(adjacency)))
+    G.add_edges_from((u, v) for u, neighbors in enumerate(adjacency) for v in neighbors if u < v)
+    return G
+
+
+# Packed-bitset adjacency: row v holds one bit per vertex in little-endian uint64 words,
+# so a dense graph costs about n^2 / 8 bytes instead of hundreds of bytes per edge
+def _pack_rows(block):
+    packed = np.packbits(block, axis=1, bitorder="little")
+    padding = -packed.shape[1] % 8
+    if padding:
+        packed = np.pad(packed, ((0, 0), (0, padding)))
+    return np.ascontiguousarray(packed).view("<u8")
+
+
+# Function to unpack bitset rows back to a boolean matrix with x columns
+def _unpack_rows(rows, x):
+    return np.unpackbits(rows.view(np.uint8), axis=1, count=x, bitorder="little").astype(bool)
+
+
+# Function to generate G(x, probability) directly as bitset rows, one square block of the
+# upper triangle at a time (block must be a multiple of 64 so blocks align with words)
+def generate_bitset_graph(x, probability=0.5, seed=None, block=2048):
+    rng = np.random.default_rng(seed)
+    rows = np.zeros((x, (x + 63) // 64), dtype="<u8")
+    for i in range(0, x, block):
+        height = min(block, x - i)
+        for j in range(i, x, block):
+            width = min(block, x - j)
+            bits = rng.random((height, width)) < probability
+            if i == j:
+                bits = np.triu(bits, k=1)
+                bits |= bits.T
+            rows[i:i + height, j // 64:j // 64 + (width + 63) // 64] = _pack_rows(bits)
+            if i != j:
+                rows[j:j + width, i // 64:i // 64 + (height + 63) // 64] = _pack_rows(bits.T)
+    return rows
+
+
+# Function to count the neighbours of every vertex of a bitset graph
+def bitset_degrees(rows):
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(rows).sum(axis=1, dtype=np.int64)
+    return np.unpackbits(rows.view(np.uint8), axis=1).sum(axis=1, dtype=np.int64)
+
+
+# Function to relabel a bitset graph so that vertex order[k] becomes vertex k
+def permute_bitset(rows, order, block=2048):
+    x = len(order)
+    permuted = np.empty_like(rows)
+    for i in range(0, x, block):
+        permuted[i:i + block] = _pack_rows(_unpack_rows(rows[order[i:i + block]], x)[:, order])
+    return permuted
+
+
+# Function to convert bitset rows to adjacency lists (small graphs only)
+def bitset_to_adjacency(rows, x):
+    return [np.flatnonzero(row).tolist() for row in _unpack_rows(rows, x)]
+
+
+# Welsh-Powell on a bitset graph. First-fit greedy in degree order builds colour 0 as the greedy
+# independent set of the order, colour 1 as the greedy independent set of what is left, and so on.
+# With vertices relabelled in degree order, each class is grown by taking the lowest candidate bit
+# and clearing its neighbours from the candidates with one AND-NOT over its row, so the whole
+# colouring costs O(n^2 / 64) word operations and gives the same colours as welsh_powell_coloring.
+# Returns the list of colours indexed by vertex
+def bitset_greedy_coloring(rows, x):
+    order = np.argsort(-bitset_degrees(rows), kind="stable")
+    rows = permute_bitset(rows, order)
+    uncolored = _pack_rows(np.ones((1, x), dtype=bool))[0]
+    ranked_colors = [0] * x
+    color = 0
+
+    while True:
+        nonzero = np.flatnonzero(uncolored)
+        if nonzero.size == 0:
+            break
+        candidates = uncolored.copy()
+        word = int(nonzero[0])
+        while True:
+            value = int(candidates[word])
+            if value == 0:
+                nonzero = np.flatnonzero(candidates[word:])
+                if nonzero.size == 0:
+                    break
+                word += int(nonzero[0])
+                value = int(candidates[word])
+            bit = (value & -value).bit_length() - 1
+            vertex = word * 64 + bit
+            ranked_colors[vertex] = color
+            uncolored[word] ^= np.uint64(1 << bit)
+            candidates[word] ^= np.uint64(1 << bit)
+            candidates[word:] &= ~rows[vertex, word:]
+        color += 1
+
+    coloring = [0] * x
+    for rank, vertex in enumerate(order.tolist()):
+        coloring[vertex] = ranked_colors[rank]
+    return coloring
+
+
 def on_enter(event, canvas, rect):
     canvas.itemconfig(rect, fill="#72BAA9")  # Coral color for hover
 
@@ -53,41 +187,415 @@ def create_rounded_rectangle(canvas, x1, y1, x2, y2, radius=25, **kwargs):
     return canvas.create_polygon(points, **kwargs, smooth=True)
 
 
-# Welsh-Powell algorithm for graph coloring
-def welsh_powell_algorithm(G):
-    nodes_sorted = sorted(G.nodes(), key=lambda x: G.degree(x), reverse=True)
-    coloring = {}
-    current_color = 0
-
-    for node in nodes_sorted:
-        if node not in coloring:
-            neighbor_colors = {coloring[neighbor] for neighbor in G.neighbors(node) if neighbor in coloring}
-            for color in range(current_color + 1):
-                if color not in neighbor_colors:
-                    coloring[node] = color
-                    break
-            else:
-                current_color += 1
-                coloring[node] = current_color
+# Function to order the nodes by decreasing degree with a counting sort (ties keep node order)
+def degree_order(adjacency):
+    buckets = [[] for _ in range(max(map(len, adjacency), default=0) + 1)]
+    for node, neighbors in enumerate(adjacency):
+        buckets[len(neighbors)].append(node)
+    return [node for bucket in reversed(buckets) for node in bucket]
+
+
+# Welsh-Powell on adjacency lists: each node takes the smallest colour not stamped by a
+# coloured neighbour, so a node costs O(degree) whatever the number of colours.
+# Returns the list of colours indexed by node
+def welsh_powell_coloring(adjacency):
+    coloring = [-1] * len(adjacency)
+    stamp = [-1] * (len(adjacency) + 1)  # stamp[color] == node: color is used around node
+
+    for node in degree_order(adjacency):
+        for neighbor in adjacency[node]:
+            color = coloring[neighbor]
+            if color >= 0:
+                stamp[color] = node
+        color = 0
+        while stamp[color] == node:
+            color += 1
+        coloring[node] = color
 
     return coloring
 
 
-# Function to draw the colored graph
-def draw_colored_graph(G, coloring, canvas_frame):
-    colors_list = list(mcolors.CSS4_COLORS.values())
-    unique_colors = random.sample(colors_list, max(coloring.values()) + 1)
-    colors = [unique_colors[coloring[node]] for node in G.nodes()]
+# DSATUR: always colour the uncoloured node that sees the most distinct colours (its saturation),
+# ties broken by degree. Nodes sit in one heap per saturation level (the buckets); a node is
+# pushed again when its saturation grows and stale entries are skipped when popped.
+# Returns the list of colours indexed by node
+def dsatur_coloring(adjacency):
+    n = len(adjacency)
+    coloring = [-1] * n
+    saturation = [0] * n
+    neighbor_colors = [set() for _ in range(n)]
+    buckets = [[(-len(neighbors), node) for node, neighbors in enumerate(adjacency)]]
+    heapq.heapify(buckets[0])
+    top = 0
+
+    for _ in range(n):
+        while True:
+            while not buckets[top]:
+                top -= 1
+            _, node = heapq.heappop(buckets[top])
+            if coloring[node] == -1 and saturation[node] == top:
+                break
+
+        seen = neighbor_colors[node]
+        color = 0
+        while color in seen:
+            color += 1
+        coloring[node] = color
+        neighbor_colors[node] = None
+
+        for neighbor in adjacency[node]:
+            if coloring[neighbor] == -1 and color not in neighbor_colors[neighbor]:
+                neighbor_colors[neighbor].add(color)
+                saturation[neighbor] += 1
+                level = saturation[neighbor]
+                if level == len(buckets):
+                    buckets.append([])
+                heapq.heappush(buckets[level], (-len(adjacency[neighbor]), neighbor))
+                top = max(top, level)
+
+    return coloring
+
+
+# Function to copy an array into a new shared memory block; returns (block, array view)
+def _share_array(array):
+    block = shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+    view = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+    view[:] = array
+    return block, view
+
+
+# Worker initializer: attach the shared CSR adjacency, priorities and colours
+def _init_jones_plassmann(specs):
+    global _jp_blocks, _jp_arrays
+    _jp_blocks = [shared_memory.SharedMemory(name=name) for name, _, _ in specs]
+    _jp_arrays = [np.ndarray(shape, dtype=dtype, buffer=block.buf)
+                  for block, (_, shape, dtype) in zip(_jp_blocks, specs)]
+
+
+# Function to colour the local maxima of one vertex range for the current round.
+# Colours of earlier rounds are read from shared memory; the new ones are returned to the
+# parent, which writes them between rounds so every worker sees the same state
+def _jones_plassmann_round(task):
+    lo, hi = task
+    offsets, targets, priority, colors = _jp_arrays
+    start, end = offsets[lo], offsets[hi]
+    neighbors = targets[start:end]
+    owner = np.repeat(np.arange(hi - lo), np.diff(offsets[lo:hi + 1]))
+    # Highest priority among the uncoloured neighbours of every vertex (-1 if none)
+    best = np.full(hi - lo, -1, dtype=np.int64)
+    uncolored = colors[neighbors] < 0
+    np.maximum.at(best, owner[uncolored], priority[neighbors[uncolored]])
+    maxima = np.flatnonzero((colors[lo:hi] < 0) & (priority[lo:hi] > best)) + lo
+
+    chosen = []
+    for vertex in maxima.tolist():
+        used = set(colors[targets[offsets[vertex]:offsets[vertex + 1]]].tolist())
+        color = 0
+        while color in used:
+            color += 1
+        chosen.append(color)
+    return maxima, np.array(chosen, dtype=np.int32)
+
+
+# Jones-Plassmann colouring: every vertex gets a random priority, and each round colours the
+# uncoloured vertices whose priority beats all their uncoloured neighbours. Those local maxima
+# form an independent set, so the vertex ranges are handled by a worker pool over a CSR copy
+# of the graph in shared memory. Returns (list of colours indexed by node, number of rounds)
+def jones_plassmann_coloring(adjacency, processes=None, seed=None):
+    x = len(adjacency)
+    processes = processes or os.cpu_count() or 1
+    degrees = np.fromiter(map(len, adjacency), dtype=np.int64, count=x)
+    offsets = np.zeros(x + 1, dtype=np.int64)
+    np.cumsum(degrees, out=offsets[1:])
+    targets = np.fromiter((v for neighbors in adjacency for v in neighbors), dtype=np.int32, count=int(offsets[-1]))
+    priority = np.random.default_rng(seed).permutation(x).astype(np.int64)
+    colors = np.full(x, -1, dtype=np.int32)
+
+    # Vertex ranges with about the same number of edges each
+    inner = np.searchsorted(offsets, np.linspace(0, offsets[-1], processes + 1)[1:-1])
+    bounds = np.unique(np.concatenate(([0], inner.clip(0, x), [x])))
+    tasks = [(int(lo), int(hi)) for lo, hi in zip(bounds[:-1], bounds[1:]) if hi > lo]
+
+    shared = [_share_array(array) for array in (offsets, targets, priority, colors)]
+    specs = [(block.name, view.shape, view.dtype) for block, view in shared]
+    colors = shared[3][1]
+    rounds = 0
+    try:
+        with multiprocessing.Pool(processes, _init_jones_plassmann, (specs,)) as pool:
+            remaining = x
+            while remaining:
+                rounds += 1
+                for vertices, chosen in pool.map(_jones_plassmann_round, tasks):
+                    colors[vertices] = chosen
+                    remaining -= len(vertices)
+        coloring = colors.tolist()
+    finally:
+        del colors
+        for block, view in shared:
+            del view
+            block.close()
+            block.unlink()
+    return coloring, rounds
+
+
+# Function to find a large clique greedily (a lower bound on the chromatic number): from each of
+# the highest-degree vertices, keep adding the candidate with the most neighbours among the candidates
+def greedy_clique(adjacency, starts=50):
+    masks = [sum(1 << v for v in neighbors) for neighbors in adjacency]
+    best = []
+    for start in degree_order(adjacency)[:starts]:
+        clique = [start]
+        candidates = masks[start]
+        while candidates:
+            vertex = max((v for v in range(len(adjacency)) if candidates >> v & 1),
+                         key=lambda v: (masks[v] & candidates).bit_count())
+            clique.append(vertex)
+            candidates &= masks[vertex]
+        if len(clique) > len(best):
+            best = clique
+    return best
+
+
+# Exact chromatic number by DSATUR branch-and-bound. The search starts from the best greedy
+# colouring (upper bound) with a greedy clique pre-coloured 0..q-1 (lower bound q), always branches
+# on the uncoloured vertex of highest saturation, and only tries colourings that would beat the
+# current upper bound. It stops when the bounds meet, the tree is exhausted or time runs out.
+# Returns (best colouring, {"lower_bound", "upper_bound", "optimal", "nodes", "time"})
+def exact_coloring(adjacency, time_limit=10.0):
+    start_time = time.time()
+    x = len(adjacency)
+    best = min((welsh_powell_coloring(adjacency), dsatur_coloring(adjacency)), key=lambda c: max(c, default=-1))
+    upper = max(best, default=-1) + 1
+    clique = greedy_clique(adjacency)
+    lower = len(clique)
+    stats = {"lower_bound": lower, "upper_bound": upper, "optimal": lower == upper, "nodes": 0}
+
+    coloring = [-1] * x
+    neighbor_count = [[0] * max(upper, 1) for _ in range(x)]  # coloured neighbours per colour
+    saturation = [0] * x
+    free_degree = [len(neighbors) for neighbors in adjacency]  # uncoloured neighbours
+
+    def assign(vertex, color):
+        coloring[vertex] = color
+        for neighbor in adjacency[vertex]:
+            free_degree[neighbor] -= 1
+            if neighbor_count[neighbor][color] == 0:
+                saturation[neighbor] += 1
+            neighbor_count[neighbor][color] += 1
+
+    def unassign(vertex):
+        color = coloring[vertex]
+        coloring[vertex] = -1
+        for neighbor in adjacency[vertex]:
+            free_degree[neighbor] += 1
+            neighbor_count[neighbor][color] -= 1
+            if neighbor_count[neighbor][color] == 0:
+                saturation[neighbor] -= 1
+
+    for color, vertex in enumerate(clique):
+        assign(vertex, color)
+    used = lower
+
+    # Each frame is [vertex, colours to try, next option, whether its colour opened a new class]
+    stack = []
+    timed_out = False
+    while not stats["optimal"]:
+        stats["nodes"] += 1
+        if stats["nodes"] % 1024 == 0 and time.time() - start_time > time_limit:
+            timed_out = True
+            break
+        uncolored = [v for v in range(x) if coloring[v] < 0]
+        if uncolored:
+            vertex = max(uncolored, key=lambda v: (saturation[v], free_degree[v]))
+            options = [c for c in range(used) if neighbor_count[vertex][c] == 0] + [used]
+            stack.append([vertex, options, 0, False])
+        else:
+            # Every vertex is coloured with fewer colours than the upper bound
+            best, upper = coloring[:], used
+            stats["upper_bound"] = upper
+            if upper == lower:
+                stats["optimal"] = True
+                break
+
+        # Move to the next colour of the deepest vertex that still has one, backtracking as needed
+        while stack:
+            frame = stack[-1]
+            vertex, options, index, opened = frame
+            if coloring[vertex] >= 0:
+                unassign(vertex)
+                used -= opened
+            while index < len(options) and max(used, options[index] + 1) >= upper:
+                index += 1
+            if index < len(options):
+                color = options[index]
+                frame[2], frame[3] = index + 1, color == used
+                used += frame[3]
+                assign(vertex, color)
+                break
+            stack.pop()
+        else:
+            stats["optimal"] = True  # Search tree exhausted: nothing beats the upper bound
+
+    if stats["optimal"]:
+        stats["lower_bound"] = upper
+    stats["time"] = time.time() - start_time
+    return best, stats
+
+
+# Colouring kept valid under edge insertions and deletions. An edge between two vertices of the
+# same colour only recolours its lower-degree endpoint: first with a colour free around it, then by
+# moving the single neighbour that blocks some colour, and only as a last resort with a new colour.
+# Every update returns {vertex: new colour} for the vertices that changed
+class IncrementalColoring:
+    def __init__(self, adjacency, coloring):
+        self.adjacency = [set(neighbors) for neighbors in adjacency]
+        self.coloring = list(coloring)
+        self.class_size = [0] * (max(coloring, default=-1) + 1)
+        for color in coloring:
+            self.class_size[color] += 1
+
+    # Function to count the colours in use (emptied classes are not counted)
+    def num_colors(self):
+        return sum(1 for size in self.class_size if size)
+
+    def _set_color(self, vertex, color, changes):
+        self.class_size[self.coloring[vertex]] -= 1
+        if color == len(self.class_size):
+            self.class_size.append(0)
+        self.class_size[color] += 1
+        self.coloring[vertex] = color
+        changes[vertex] = color
+        while self.class_size and self.class_size[-1] == 0:
+            self.class_size.pop()
+
+    # Function to return the smallest colour below limit that no neighbour of vertex uses, or None
+    def _free_color(self, vertex, limit, forbidden=()):
+        used = {self.coloring[neighbor] for neighbor in self.adjacency[vertex]}
+        for color in range(limit):
+            if color not in used and color not in forbidden:
+                return color
+        return None
+
+    def _repair(self, vertex, changes):
+        limit = len(self.class_size)
+        color = self._free_color(vertex, limit)
+        if color is None:
+            holders = {}
+            for neighbor in self.adjacency[vertex]:
+                holders.setdefault(self.coloring[neighbor], []).append(neighbor)
+            for color in range(limit):
+                if len(holders.get(color, ())) == 1:
+                    blocker = holders[color][0]
+                    new_color = self._free_color(blocker, limit, forbidden=(color,))
+                    if new_color is not None:
+                        self._set_color(blocker, new_color, changes)
+                        break
+            else:
+                color = limit
+        if color != self.coloring[vertex]:
+            self._set_color(vertex, color, changes)
+
+    # Function to add edge (u, v) and repair the colouring if both ends share a colour
+    def add_edge(self, u, v):
+        changes = {}
+        if u == v or v in self.adjacency[u]:
+            return changes
+        self.adjacency[u].add(v)
+        self.adjacency[v].add(u)
+        if self.coloring[u] == self.coloring[v]:
+            self._repair(u if len(self.adjacency[u]) <= len(self.adjacency[v]) else v, changes)
+        return changes
+
+    # Function to remove edge (u, v); with compact, both ends move down to their smallest free colour
+    def remove_edge(self, u, v, compact=True):
+        changes = {}
+        if v not in self.adjacency[u]:
+            return changes
+        self.adjacency[u].discard(v)
+        self.adjacency[v].discard(u)
+        if compact:
+            for vertex in (u, v):
+                color = self._free_color(vertex, self.coloring[vertex])
+                if color is not None:
+                    self._set_color(vertex, color, changes)
+        return changes
+
+
+# Vertex limit for the exact solver in the window
+MAX_EXACT_VERTICES = 500
+
+
+# Available colouring engines, all taking adjacency lists and returning a colour per node
+# (round-based engines return (colours, number of rounds))
+COLORING_ENGINES = {
+    "Welsh-Powell": welsh_powell_coloring,
+    "DSATUR": dsatur_coloring,
+    "Jones-Plassmann (parallel)": jones_plassmann_coloring,
+}
+
+# Engines that also run directly on bitset rows (dense graphs)
+BITSET_ENGINES = {
+    "Welsh-Powell": bitset_greedy_coloring,
+}
+
+# Graphs with more vertices than this are coloured but not drawn
+MAX_DRAWN_VERTICES = 60
+
+# Dense graphs with more vertices than this stay in bitset form (no adjacency lists)
+MAX_DENSE_LIST_VERTICES = 3000
+
+
+# Welsh-Powell algorithm for graph coloring
+def welsh_powell_algorithm(G):
+    nodes, adjacency = graph_to_adjacency(G)
+    return dict(zip(nodes, welsh_powell_coloring(adjacency)))
+
+
+# Drawing of a coloured graph that keeps its node and edge artists, so an update only
+# rewrites the face colours of the nodes that changed and the segments of the edited edge
+class ColoredGraphDrawing:
+    def __init__(self, G, coloring, canvas_frame):
+        colors_list = list(mcolors.CSS4_COLORS.values())
+        self.palette = random.sample(colors_list, max(coloring.values()) + 1)
+        self.index = {node: i for i, node in enumerate(G.nodes())}
+
+        # Create a Matplotlib figure
+        fig, ax = plt.subplots(figsize=(5, 5))
+        self.positions = nx.spring_layout(G)
+        self.edges = {frozenset(edge) for edge in G.edges()}
+        self.edge_artist = LineCollection(self._segments(), colors="black", zorder=1)
+        ax.add_collection(self.edge_artist)
+        self.node_artist = nx.draw_networkx_nodes(G, self.positions, ax=ax, node_size=500,
+                                                  node_color=[self.palette[coloring[node]] for node in G.nodes()])
+        nx.draw_networkx_labels(G, self.positions, ax=ax, font_size=10)
+        ax.set_axis_off()
+        self.face_colors = self.node_artist.get_facecolors().copy()
+
+        # Embed the figure in the Tkinter window
+        self.canvas = FigureCanvasTkAgg(fig, master=canvas_frame)
+        canvas_widget = self.canvas.get_tk_widget()
+        canvas_widget.pack(fill=tk.BOTH, expand=True)
+        self.canvas.draw()
+
+    def _segments(self):
+        return [[self.positions[u], self.positions[v]] for u, v in map(tuple, self.edges)]
+
+    # Function to redraw an edge change and the node colours it caused ({node: colour})
+    def update(self, changes, edge=None, present=True):
+        if edge is not None:
+            (self.edges.add if present else self.edges.discard)(frozenset(edge))
+            self.edge_artist.set_segments(self._segments())
+        for node, color in changes.items():
+            while color >= len(self.palette):
+                self.palette.append(random.choice([c for c in mcolors.CSS4_COLORS.values() if c not in self.palette]))
+            self.face_colors[self.index[node]] = mcolors.to_rgba(self.palette[color])
+        self.node_artist.set_facecolors(self.face_colors)
+        self.canvas.draw_idle()
 
-    # Create a Matplotlib figure
-    fig, ax = plt.subplots(figsize=(5, 5))
-    nx.draw(G, ax=ax, with_labels=True, node_color=colors, node_size=500, font_size=10)
 
-    # Embed the figure in the Tkinter window
-    canvas = FigureCanvasTkAgg(fig, master=canvas_frame)
-    canvas_widget = canvas.get_tk_widget()
-    canvas_widget.pack(fill=tk.BOTH, expand=True)
-    canvas.draw()
+# Function to draw the colored graph
+def draw_colored_graph(G, coloring, canvas_frame):
+    return ColoredGraphDrawing(G, coloring, canvas_frame)
 
 
 # Main execution
@@ -104,15 +612,71 @@ def welshpowel():
             # Measure the total execution time
             start_time = time.time()
 
-            random_graph = generate_random_graph(x)
-            coloring = welsh_powell_algorithm(random_graph)
+            # Dense G(x, 0.5) as bitset rows by default, sparse adjacency lists when an average degree is given
+            degree_input = degree_entry.get().strip()
+            rows = None
+            if degree_input:
+                if not degree_input.isdigit():
+                    messagebox.showwarning("Input Error", "Please enter a valid average degree.")
+                    return
+                adjacency = generate_sparse_adjacency(x, int(degree_input))
+            else:
+                rows = generate_bitset_graph(x)
+                adjacency = bitset_to_adjacency(rows, x) if x <= MAX_DENSE_LIST_VERTICES else None
+
+            # Run every engine and compare the number of colours
+            colorings = {}
+            summary = []
+            for name, engine in COLORING_ENGINES.items():
+                engine_start = time.time()
+                if rows is not None and name in BITSET_ENGINES:
+                    colorings[name] = BITSET_ENGINES[name](rows, x)
+                elif adjacency is not None:
+                    colorings[name] = engine(adjacency)
+                else:
+                    summary.append(f"{name}: skipped (graph too large for adjacency lists)")
+                    continue
+                rounds = ""
+                if isinstance(colorings[name], tuple):
+                    colorings[name], round_count = colorings[name]
+                    rounds = f", {round_count} rounds"
+                colors_used = max(colorings[name], default=-1) + 1
+                summary.append(f"{name}: {colors_used} colors{rounds} ({time.time() - engine_start:.4f} s)")
+            compare_label.config(text="\n".join(summary))
+            if engine_choice.get() not in colorings:
+                messagebox.showwarning("Input Error", f"{engine_choice.get()} needs adjacency lists; "
+                                                      f"dense graphs above {MAX_DENSE_LIST_VERTICES} vertices only support "
+                                                      f"{', '.join(BITSET_ENGINES)}.")
+                return
+            coloring = colorings[engine_choice.get()]
+
+            # Greedy engines only give an upper bound; the exact solver proves the optimum when it can
+            num_colors = max(coloring, default=-1) + 1
+            try:
+                time_limit = float(time_limit_entry.get())
+            except ValueError:
+                time_limit = 0
+            if adjacency is not None and x <= MAX_EXACT_VERTICES and time_limit > 0:
+                _, exact = exact_coloring(adjacency, time_limit)
+                if exact["optimal"]:
+                    result_label.config(text=f"Chromatic number is: {exact['upper_bound']} (proven optimal, "
+                                             f"{exact['nodes']} nodes, {exact['time']:.4f} s)\n"
+                                             f"{engine_choice.get()} used {num_colors} colors")
+                else:
+                    result_label.config(text=f"Chromatic number is between {exact['lower_bound']} and "
+                                             f"{exact['upper_bound']} (time limit reached after {exact['nodes']} nodes)\n"
+                                             f"{engine_choice.get()} used {num_colors} colors")
+            else:
+                result_label.config(text=f"{engine_choice.get()} used {num_colors} colors "
+                                         f"(an upper bound on the chromatic number)")
 
-            # Display the number of colors used
-            num_colors = max(coloring.values()) + 1
-            result_label.config(text=f"Chromatic number is: {num_colors}")
+            # Keep the colouring for edge edits
+            on_submit.incremental = IncrementalColoring(adjacency, coloring) if adjacency is not None else None
+            on_submit.drawing = None
 
             # Draw the colored graph
-            draw_colored_graph(random_graph, coloring, canvas_frame)
+            if x <= MAX_DRAWN_VERTICES:
+                on_submit.drawing = draw_colored_graph(adjacency_to_graph(adjacency), dict(enumerate(coloring)), canvas_frame)
 
             # Calculate the total execution time
             end_time = time.time()
@@ -143,9 +707,23 @@ def welshpowel():
     entry = tk.Entry(input_frame)
     entry.grid(row=0, column=1, pady=5, padx=5)
 
+    tk.Label(input_frame, text="Average degree (empty = dense):", bg="#F0F0F0").grid(row=0, column=2, pady=5, padx=5)
+    degree_entry = tk.Entry(input_frame, width=8)
+    degree_entry.grid(row=0, column=3, pady=5, padx=5)
+
+    tk.Label(input_frame, text="Engine:", bg="#F0F0F0").grid(row=0, column=4, pady=5, padx=5)
+    engine_choice = ttk.Combobox(input_frame, values=list(COLORING_ENGINES), state="readonly", width=14)
+    engine_choice.current(0)
+    engine_choice.grid(row=0, column=5, pady=5, padx=5)
+
+    tk.Label(input_frame, text="Exact time limit (s):", bg="#F0F0F0").grid(row=0, column=6, pady=5, padx=5)
+    time_limit_entry = tk.Entry(input_frame, width=6)
+    time_limit_entry.grid(row=0, column=7, pady=5, padx=5)
+    time_limit_entry.insert(0, "5")
+
     # Styled Submit Button
     canvas = tk.Canvas(input_frame, width=150, height=50, bg="#F0F0F0", highlightthickness=0)
-    canvas.grid(row=1, column=0, columnspan=2, pady=10)
+    canvas.grid(row=1, column=0, columnspan=8, pady=10)
 
     rect = create_rounded_rectangle(canvas, 10, 10, 140, 40, radius=20, fill="#E0F7FA", outline="#008080", width=2)
     label = canvas.create_text(75, 25, text="Submit", font=("Arial", 10), fill="#008080")
@@ -161,9 +739,48 @@ def welshpowel():
     canvas.tag_bind(label, "<Enter>", lambda event: on_enter(event, canvas, rect))
     canvas.tag_bind(label, "<Leave>", lambda event: on_leave(event, canvas, rect))
 
+    # Edge edits: add or remove one edge and repair the colouring locally
+    def edit_edge(add):
+        incremental = getattr(on_submit, "incremental", None)
+        if incremental is None:
+            messagebox.showwarning("Input Error", "Colour a graph with adjacency lists first.")
+            return
+        try:
+            u, v = map(int, edge_entry.get().split())
+            if not (0 <= u < len(incremental.coloring) and 0 <= v < len(incremental.coloring)) or u == v:
+                raise ValueError
+        except ValueError:
+            messagebox.showwarning("Input Error", "Please enter two different vertices (e.g. 3 7).")
+            return
+        start_time = time.perf_counter()
+        changes = incremental.add_edge(u, v) if add else incremental.remove_edge(u, v)
+        update_time = time.perf_counter() - start_time
+        if on_submit.drawing is not None:
+            on_submit.drawing.update(changes, (u, v), present=add)
+        recolored = ", ".join(f"{vertex} -> {color}" for vertex, color in changes.items()) or "none"
+        result_label.config(text=f"Edge {u}-{v} {'added' if add else 'removed'}: {incremental.num_colors()} colors\n"
+                                 f"Recolored: {recolored} ({update_time * 1000:.3f} ms)")
+
+    edit_frame = tk.Frame(inner_frame, bg="#F0F0F0")
+    edit_frame.pack(pady=5)
+    tk.Label(edit_frame, text="Edge (u v):", bg="#F0F0F0").pack(side=tk.LEFT, padx=5)
+    edge_entry = tk.Entry(edit_frame, width=10)
+    edge_entry.pack(side=tk.LEFT, padx=5)
+    for text, add in (("Add Edge", True), ("Remove Edge", False)):
+        button = tk.Canvas(edit_frame, width=130, height=50, bg="#F0F0F0", highlightthickness=0)
+        button.pack(side=tk.LEFT, padx=5)
+        button_rect = create_rounded_rectangle(button, 10, 10, 120, 40, radius=20, fill="#E0F7FA", outline="#008080", width=2)
+        button_label = button.create_text(65, 25, text=text, font=("Arial", 10), fill="#008080")
+        for item in (button_rect, button_label):
+            button.tag_bind(item, "<Button-1>", lambda event, add=add: edit_edge(add))
+            button.tag_bind(item, "<Enter>", lambda event, c=button, r=button_rect: on_enter(event, c, r))
+            button.tag_bind(item, "<Leave>", lambda event, c=button, r=button_rect: on_leave(event, c, r))
+
     # Result labels
     result_label = tk.Label(inner_frame, text="", bg="#F0F0F0", font=("Arial", 10))
     result_label.pack(pady=5)
+    compare_label = tk.Label(inner_frame, text="", bg="#F0F0F0", font=("Arial", 10))
+    compare_label.pack(pady=5)
     time_label = tk.Label(inner_frame, text="", bg="#F0F0F0", font=("Arial", 10))
     time_label.pack(pady=5)
 
@@ -175,4 +792,5 @@ def welshpowel():
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     welshpowel()
@@ -2,6 +2,7 @@ import tkinter as tk
 from PIL import Image, ImageTk, ImageOps
 import sys
 import os
+import multiprocessing
 from algos import render_algorithmes_page
 
 def resource_path(relative_path):
@@ -185,4 +186,5 @@ def create_interface():
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     create_interface()